@@ -0,0 +1,58 @@
+# agents/_kernels.py
+# Compiled per-ticker price kernels for Agent 5.
+#
+# Plain loops over a float64 close array (no pandas, no temporaries) so numba
+# can compile them; without numba they run as ordinary Python. Callers strip
+# NaNs and check history length before dispatching here.
+#
+# Only the scalar helpers _compute_momentum / _compute_volatility use these —
+# the reference definitions the tests check against. The pipeline itself
+# scores through compute_factor_scores_vectorized and never calls them.
+
+import math
+
+import numpy as np
+
+from utils.jit import njit
+
+
+@njit(cache=True)
+def momentum_kernel(close: np.ndarray, long_window: int, short_window: int) -> float:
+    """
+    Return from close[-long_window] to close[-short_window].
+
+    NaN if the starting price is non-positive. close must hold at least
+    long_window prices.
+    """
+    price_then = close[close.size - long_window]
+    price_recent = close[close.size - short_window]
+    if price_then <= 0:
+        return np.nan
+    return (price_recent - price_then) / price_then
+
+
+@njit(cache=True)
+def volatility_kernel(close: np.ndarray, window: int) -> float:
+    """
+    Sample std (ddof=1) of daily log returns over the last window prices,
+    annualised by sqrt(252).
+
+    NaN if any price in the window is non-positive. close must hold at
+    least window prices, and window must be at least 3.
+    """
+    start = close.size - window
+    for i in range(start, close.size):
+        if close[i] <= 0:
+            return np.nan
+
+    n = window - 1
+    total = 0.0
+    for i in range(start + 1, close.size):
+        total += math.log(close[i] / close[i - 1])
+    mean = total / n
+
+    sq = 0.0
+    for i in range(start + 1, close.size):
+        d = math.log(close[i] / close[i - 1]) - mean
+        sq += d * d
+    return math.sqrt(sq / (n - 1)) * math.sqrt(252.0)
@@ -11,7 +11,15 @@
 import logging
 from dataclasses import dataclass
 
-from data.skeleton.base_provider import DataProvider, DataProviderError
+import numpy as np
+import pandas as pd
+
+from data.skeleton.base_provider import (
+    DataProvider,
+    DataProviderError,
+    Fundamentals,
+    FUNDAMENTAL_FIELDS,
+)
 from config.settings import (
     MIN_MARKET_CAP,
     MIN_AVG_DAILY_VOLUME_USD,
@@ -22,7 +30,7 @@ from config.settings import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScreeningResult:
     """Result for a single ticker after hard screening."""
     ticker: str
@@ -33,81 +41,173 @@ class ScreeningResult:
 def screen_universe(
     tickers: list[str],
     data_provider: DataProvider,
-) -> tuple[list[str], list[ScreeningResult]]:
+    return_reasons: bool = True,
+) -> tuple[list[str], list[ScreeningResult]] | list[str]:
     """
     Run hard screening filters on a list of tickers.
 
     Args:
         tickers:        Raw universe from Agent 3 sector selection
         data_provider:  DataProvider instance
+        return_reasons: If False, skip building ScreeningResults and
+                        rejection reasons and return passed_tickers only
 
     Returns:
         passed_tickers: List of tickers that cleared all filters
         results:        Full ScreeningResult list for auditing/logging
+                        (only when return_reasons is True)
     """
-    results: list[ScreeningResult] = []
+    # ── Fetch fundamentals ──────────────────────────────────────────────────
+    data_provider.prefetch_fundamentals(tickers)
 
+    fundamentals = {}
+    unavailable = {}
     for ticker in tickers:
-        result = _screen_single(ticker, data_provider)
-        results.append(result)
-
-        if result.passed:
-            logger.debug(f"PASS  {ticker}: {result.reason}")
-        else:
-            logger.debug(f"FAIL  {ticker}: {result.reason}")
+        try:
+            fundamentals[ticker] = Fundamentals.coerce(data_provider.get_fundamentals(ticker))
+        except DataProviderError as e:
+            if return_reasons:
+                unavailable[ticker] = ScreeningResult(ticker, False, f"Data unavailable: {e}")
+
+    fundamentals_df = pd.DataFrame(
+        list(fundamentals.values()), index=list(fundamentals), columns=FUNDAMENTAL_FIELDS
+    )
+
+    if not return_reasons:
+        first_failure, _ = _first_failures(fundamentals_df)
+        passing = set(fundamentals_df.index[first_failure == _PASSED])
+        passed = [t for t in tickers if t in passing]
+        logger.info("Screening complete: %d/%d passed", len(passed), len(tickers))
+        return passed
+
+    _, mask, reasons = screen_universe_vectorized(fundamentals_df)
+    # One pass over the mask to build the per-ticker dataclasses
+    screened = {
+        ticker: ScreeningResult(ticker, ok, reason)
+        for ticker, ok, reason in zip(fundamentals_df.index, mask.tolist(), reasons)
+    }
+    results = [unavailable.get(ticker) or screened[ticker] for ticker in tickers]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for result in results:
+            logger.debug(
+                "%s  %s: %s", "PASS" if result.passed else "FAIL", result.ticker, result.reason
+            )
 
     passed = [r.ticker for r in results if r.passed]
-    logger.info(f"Screening complete: {len(passed)}/{len(tickers)} passed")
+    logger.info("Screening complete: %d/%d passed", len(passed), len(tickers))
 
     return passed, results
 
 
-def _screen_single(ticker: str, data_provider: DataProvider) -> ScreeningResult:
-    """Apply all hard filters to a single ticker. Returns on first failure."""
+def screen_universe_vectorized(
+    fundamentals_df: pd.DataFrame,
+) -> tuple[list[str], np.ndarray, list[str]]:
+    """
+    Apply all hard filters to every ticker at once.
 
-    # ── Fetch fundamentals ──────────────────────────────────────────────────
-    try:
-        fundamentals = data_provider.get_fundamentals(ticker)
-    except DataProviderError as e:
-        return ScreeningResult(ticker, False, f"Data unavailable: {e}")
-
-    # ── Filter 1: Minimum price ──────────────────────────────────────────────
-    price = fundamentals.get("price")
-    if price is None:
-        return ScreeningResult(ticker, False, "Price unavailable")
-    if price < MIN_PRICE:
-        return ScreeningResult(ticker, False, f"Price ${price:.2f} below minimum ${MIN_PRICE}")
-
-    # ── Filter 2: Minimum market cap ─────────────────────────────────────────
-    market_cap = fundamentals.get("market_cap")
-    if market_cap is None:
-        return ScreeningResult(ticker, False, "Market cap unavailable")
-    if market_cap < MIN_MARKET_CAP:
-        return ScreeningResult(
-            ticker, False,
-            f"Market cap ${market_cap/1e9:.1f}B below minimum ${MIN_MARKET_CAP/1e9:.1f}B"
-        )
+    Each filter is a boolean column comparison. A ticker's rejection reason
+    is its first failing filter, in the order listed in _FILTER_ORDER.
 
-    # ── Filter 3: Minimum average daily volume ───────────────────────────────
-    avg_vol = fundamentals.get("avg_daily_volume")
-    if avg_vol is None:
-        return ScreeningResult(ticker, False, "Average volume unavailable")
-    if avg_vol < MIN_AVG_DAILY_VOLUME_USD:
-        return ScreeningResult(
-            ticker, False,
-            f"Avg daily volume ${avg_vol/1e6:.1f}M below minimum ${MIN_AVG_DAILY_VOLUME_USD/1e6:.1f}M"
-        )
+    Args:
+        fundamentals_df: Fundamentals indexed by ticker, FUNDAMENTAL_FIELDS columns
+                         (NaN/None where unavailable)
 
-    # ── Filter 4: Maximum debt-to-equity ─────────────────────────────────────
-    dte = fundamentals.get("debt_to_equity")
-    if dte is not None and dte > MAX_DEBT_TO_EQUITY:
-        return ScreeningResult(
-            ticker, False,
-            f"Debt/equity {dte:.1f} exceeds maximum {MAX_DEBT_TO_EQUITY}"
+    Returns:
+        passed_tickers: Tickers that cleared all filters, in frame order
+        mask:           Boolean array aligned with fundamentals_df.index
+        reasons:        Reason string per row, aligned with fundamentals_df.index
+    """
+    first_failure, values = _first_failures(fundamentals_df)
+    mask = first_failure == _PASSED
+
+    # Only rejected rows need a formatted reason; passes share one string
+    reasons = [_PASS_REASON] * len(mask)
+    for i in np.flatnonzero(~mask):
+        reasons[i] = _rejection_reason(
+            int(first_failure[i]),
+            values["price"][i],
+            values["market_cap"][i],
+            values["avg_daily_volume"][i],
+            values["debt_to_equity"][i],
         )
 
-    # ── All filters passed ───────────────────────────────────────────────────
-    return ScreeningResult(ticker, True, "All filters passed")
+    passed = fundamentals_df.index[mask].tolist()
+    return passed, mask, reasons
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Internal helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+_SCREENED_FIELDS = ["price", "market_cap", "avg_daily_volume", "debt_to_equity"]
+
+# Filter outcome codes; np.select reports the first code whose condition holds
+_PASSED = 0
+_MCAP_MISSING, _MCAP_LOW = 1, 2
+_VOLUME_MISSING, _VOLUME_LOW = 3, 4
+_PRICE_MISSING, _PRICE_LOW = 5, 6
+_DTE_HIGH = 7
+
+# Most selective filter first: the $2B market-cap floor rejects most of a
+# small-cap universe, so it is the reason reported for multi-filter failures
+_FILTER_ORDER = [
+    _MCAP_MISSING, _MCAP_LOW,
+    _VOLUME_MISSING, _VOLUME_LOW,
+    _PRICE_MISSING, _PRICE_LOW,
+    _DTE_HIGH,
+]
+
+_PASS_REASON = "All filters passed"
+
+
+def _first_failures(fundamentals_df: pd.DataFrame) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    First failing filter code per row (_PASSED if none), plus the screened
+    columns as float64 arrays for formatting reasons.
+    """
+    cols = fundamentals_df.reindex(columns=FUNDAMENTAL_FIELDS)
+    values = {name: cols[name].to_numpy(dtype=np.float64) for name in _SCREENED_FIELDS}
+    price   = values["price"]
+    mcap    = values["market_cap"]
+    avg_vol = values["avg_daily_volume"]
+    dte     = values["debt_to_equity"]
+
+    # Comparisons against NaN are False, so a missing D/E never fails the
+    # leverage check — matching the scalar rule of skipping it when None.
+    failures = {
+        _MCAP_MISSING:   np.isnan(mcap),
+        _MCAP_LOW:       mcap < MIN_MARKET_CAP,
+        _VOLUME_MISSING: np.isnan(avg_vol),
+        _VOLUME_LOW:     avg_vol < MIN_AVG_DAILY_VOLUME_USD,
+        _PRICE_MISSING:  np.isnan(price),
+        _PRICE_LOW:      price < MIN_PRICE,
+        _DTE_HIGH:       dte > MAX_DEBT_TO_EQUITY,
+    }
+    first_failure = np.select(
+        [failures[code] for code in _FILTER_ORDER], _FILTER_ORDER, default=_PASSED
+    )
+    return first_failure, values
+
+
+def _rejection_reason(code: int, price: float, mcap: float, avg_vol: float, dte: float) -> str:
+    """Human-readable reason for a ticker's first failing filter."""
+    if code == _MCAP_MISSING:
+        return "Market cap unavailable"
+    if code == _MCAP_LOW:
+        return f"Market cap ${mcap/1e9:.1f}B below minimum ${MIN_MARKET_CAP/1e9:.1f}B"
+    if code == _VOLUME_MISSING:
+        return "Average volume unavailable"
+    if code == _VOLUME_LOW:
+        return (
+            f"Avg daily volume ${avg_vol/1e6:.1f}M below minimum "
+            f"${MIN_AVG_DAILY_VOLUME_USD/1e6:.1f}M"
+        )
+    if code == _PRICE_MISSING:
+        return "Price unavailable"
+    if code == _PRICE_LOW:
+        return f"Price ${price:.2f} below minimum ${MIN_PRICE}"
+    return f"Debt/equity {dte:.1f} exceeds maximum {MAX_DEBT_TO_EQUITY}"
 
 
 # ── NOTE: Earnings exclusion filter ─────────────────────────────────────────
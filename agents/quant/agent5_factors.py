@@ -2,7 +2,8 @@
 # Agent 5 — Factor Scoring
 #
 # Purpose: Compute continuous factor scores for each ticker that passed Agent 4.
-# Returns a FactorScores object per ticker — no ranking here, just raw scores.
+# Returns one FactorScoresBatch (a score array per factor, aligned with the
+# ticker list) — no ranking here, just raw scores.
 #
 # Factors:
 #   1. Momentum     — 12-1 month price return (excludes last month to avoid reversal)
@@ -12,13 +13,20 @@
 # All scores are raw (unscaled). Agent 6 handles normalisation and weighting.
 
 import logging
+import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
 
-from data.skeleton.base_provider import DataProvider, DataProviderError
+from agents.quant._kernels import momentum_kernel, volatility_kernel
+from data.skeleton.base_provider import (
+    DataProvider,
+    DataProviderError,
+    Fundamentals,
+    FUNDAMENTAL_FIELDS,
+)
 from config.settings import (
     MOMENTUM_LONG_WINDOW_DAYS,
     MOMENTUM_SHORT_WINDOW_DAYS,
@@ -28,7 +36,7 @@ from config.settings import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FactorScores:
     """Raw factor scores for a single ticker."""
     ticker: str
@@ -37,68 +45,250 @@ class FactorScores:
     low_vol:  float | None   # Annualised realised vol — lower = less volatile
 
 
+@dataclass(slots=True, frozen=True, eq=False)
+class FactorScoresBatch:
+    """
+    Raw factor scores for a whole universe, one array per factor.
+
+    Position i of every array belongs to tickers[i]; NaN marks a score that
+    could not be computed. Agent 6 reads the arrays directly, so no
+    per-ticker objects are built between scoring and ranking.
+    """
+    tickers:  list[str]
+    momentum: np.ndarray     # float64, 12-1 month return
+    quality:  np.ndarray     # float64, composite quality score
+    low_vol:  np.ndarray     # float64, annualised realised vol
+    scored_count: int        # tickers with at least one finite factor
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    @classmethod
+    def from_scores(cls, scores: list[FactorScores]) -> "FactorScoresBatch":
+        """Pack per-ticker FactorScores (None → NaN) into arrays."""
+        momentum = _factor_array(scores, "momentum")
+        quality = _factor_array(scores, "quality")
+        low_vol = _factor_array(scores, "low_vol")
+        return cls(
+            tickers=[s.ticker for s in scores],
+            momentum=momentum,
+            quality=quality,
+            low_vol=low_vol,
+            scored_count=_scored_count(momentum, quality, low_vol),
+        )
+
+    def to_list(self) -> list[FactorScores]:
+        """Unpack into per-ticker FactorScores (NaN → None), e.g. for logging."""
+        return [
+            FactorScores(t, _optional(m), _optional(q), _optional(v))
+            for t, m, q, v in zip(
+                self.tickers,
+                self.momentum.tolist(),
+                self.quality.tolist(),
+                self.low_vol.tolist(),
+            )
+        ]
+
+
 def compute_factor_scores(
     tickers: list[str],
     data_provider: DataProvider,
-    as_of_date: str | None = None,
-) -> list[FactorScores]:
+    as_of_date: str | pd.Timestamp | None = None,
+) -> FactorScoresBatch:
     """
     Compute factor scores for a list of tickers.
 
     Args:
         tickers:        Tickers that passed Agent 4 screening
         data_provider:  DataProvider instance
-        as_of_date:     'YYYY-MM-DD' — score as of this date.
+        as_of_date:     'YYYY-MM-DD' or Timestamp — score as of this date.
                         Defaults to today. Set explicitly for backtesting.
 
     Returns:
-        List of FactorScores, one per ticker (None scores where data was insufficient)
+        FactorScoresBatch covering every ticker (NaN where data was insufficient)
     """
-    end_date = as_of_date or datetime.today().strftime("%Y-%m-%d")
-    # We need enough history for the longest lookback
-    start_date = (
-        datetime.strptime(end_date, "%Y-%m-%d")
-        - timedelta(days=MOMENTUM_LONG_WINDOW_DAYS + 30)  # buffer
-    ).strftime("%Y-%m-%d")
+    if isinstance(as_of_date, pd.Timestamp):
+        # Already parsed — skip the string round trip in lookback_start_date
+        end_date = as_of_date.strftime("%Y-%m-%d")
+        start_date = lookback_start_date(as_of_date)
+    else:
+        end_date = as_of_date or datetime.today().strftime("%Y-%m-%d")
+        start_date = lookback_start_date(end_date)
+
+    # One batched request for the whole list rather than one per ticker
+    try:
+        price_map = data_provider.get_price_history_batch(tickers, start_date, end_date)
+    except DataProviderError as e:
+        logger.warning("Batch price fetch failed: %s", e)
+        price_map = {}
 
-    scores = []
+    # Fundamentals for the tickers we have prices for; a failed fetch for
+    # either input leaves the ticker unscored, as before
+    fundamentals = {}
     for ticker in tickers:
-        score = _score_single(ticker, data_provider, start_date, end_date)
-        scores.append(score)
-        logger.debug(
-            f"{ticker}: momentum={score.momentum}, "
-            f"quality={score.quality}, low_vol={score.low_vol}"
-        )
+        if ticker not in price_map:
+            logger.warning("No price history for %s", ticker)
+            continue
+        try:
+            fundamentals[ticker] = Fundamentals.coerce(data_provider.get_fundamentals(ticker))
+        except DataProviderError as e:
+            logger.warning("Data fetch failed for %s: %s", ticker, e)
+
+    price_matrix = pd.DataFrame(
+        {t: price_map[t]["close"] for t in fundamentals}
+    ).sort_index()
+    fundamentals_df = pd.DataFrame(
+        list(fundamentals.values()), index=list(fundamentals), columns=FUNDAMENTAL_FIELDS
+    )
+
+    scores = compute_factor_scores_vectorized(tickers, price_matrix, fundamentals_df)
+    if logger.isEnabledFor(logging.DEBUG):
+        for score in scores.to_list():
+            logger.debug(
+                "%s: momentum=%s, quality=%s, low_vol=%s",
+                score.ticker, score.momentum, score.quality, score.low_vol,
+            )
 
     return scores
 
 
+def compute_factor_scores_vectorized(
+    tickers: list[str],
+    price_matrix: pd.DataFrame,
+    fundamentals_df: pd.DataFrame,
+) -> FactorScoresBatch:
+    """
+    Compute all factors for every ticker in one NumPy pass.
+
+    Same definitions as _compute_momentum / _compute_quality /
+    _compute_volatility, applied column-wise instead of per ticker: each
+    ticker's missing closes are dropped first, so the trailing windows count
+    that ticker's own trading days, as the scalar helpers do.
+
+    Args:
+        tickers:         Tickers to score, in output order
+        price_matrix:    Close prices, one column per ticker, on a common
+                         ascending date index (NaN where a ticker has no bar)
+        fundamentals_df: Fundamentals indexed by ticker (return_on_equity,
+                         debt_to_equity columns)
+
+    Returns:
+        FactorScoresBatch in tickers order. Tickers missing from either
+        input get NaN for every factor.
+    """
+    positions = [
+        i for i, t in enumerate(tickers)
+        if t in price_matrix.columns and t in fundamentals_df.index
+    ]
+    available = [tickers[i] for i in positions]
+    raw = price_matrix.reindex(columns=available).to_numpy(dtype=np.float64)
+
+    # Each ticker's own valid closes, end-aligned: row -k is its k-th most
+    # recent close whatever dates the other tickers traded on
+    n_valid = np.count_nonzero(~np.isnan(raw), axis=0)
+    closes = _trailing_closes(raw, max(MOMENTUM_LONG_WINDOW_DAYS, VOLATILITY_WINDOW_DAYS))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # ── Momentum: 12-1 month return ──────────────────────────────────────
+        price_12m_ago = closes[-MOMENTUM_LONG_WINDOW_DAYS]
+        price_1m_ago = closes[-MOMENTUM_SHORT_WINDOW_DAYS]
+        momentum = np.where(
+            (n_valid >= MOMENTUM_LONG_WINDOW_DAYS) & (price_12m_ago > 0),
+            (price_1m_ago - price_12m_ago) / price_12m_ago,
+            np.nan,
+        )
+
+        # ── Volatility: annualised std of daily log returns ──────────────────
+        # A ticker needs its own VOLATILITY_WINDOW_DAYS valid closes, all
+        # positive; a bar missing elsewhere in the matrix doesn't count
+        low_vol = np.full(len(available), np.nan)
+        window = closes[-VOLATILITY_WINDOW_DAYS:]
+        usable = (n_valid >= VOLATILITY_WINDOW_DAYS) & (window > 0).all(axis=0)
+        log_returns = np.diff(np.log(window[:, usable]), axis=0)
+        low_vol[usable] = log_returns.std(axis=0, ddof=1) * np.sqrt(252)
+
+        # ── Quality: mean of the ROE and D/E components that are available ───
+        fund = fundamentals_df.reindex(
+            index=available, columns=["return_on_equity", "debt_to_equity"]
+        ).to_numpy(dtype=np.float64)
+        components = np.column_stack([
+            (np.clip(fund[:, 0], -0.5, 1.0) + 0.5) / 1.5,
+            1.0 - np.clip(fund[:, 1], 0.0, 3.0) / 3.0,
+        ])
+        counts = np.isfinite(components).sum(axis=1)
+        quality = np.where(counts > 0, np.nansum(components, axis=1) / counts, np.nan)
+
+    batch = FactorScoresBatch(
+        tickers=list(tickers),
+        momentum=np.full(len(tickers), np.nan),
+        quality=np.full(len(tickers), np.nan),
+        low_vol=np.full(len(tickers), np.nan),
+        # Counted here while the factor arrays are still hot
+        scored_count=_scored_count(momentum, quality, low_vol),
+    )
+    batch.momentum[positions] = momentum
+    batch.quality[positions] = quality
+    batch.low_vol[positions] = low_vol
+    return batch
+
+
+def lookback_start_date(end_date: str | datetime) -> str:
+    """
+    First date of price history needed to score as of end_date.
+
+    Exposed so callers that pre-fetch prices (e.g. the backtester)
+    request exactly the window compute_factor_scores will read.
+    Accepts 'YYYY-MM-DD' or an already-parsed datetime / Timestamp.
+    """
+    if isinstance(end_date, str):
+        end_date = datetime.strptime(end_date, "%Y-%m-%d")
+
+    # We need enough history for the longest lookback
+    return (
+        end_date - timedelta(days=MOMENTUM_LONG_WINDOW_DAYS + 30)  # buffer
+    ).strftime("%Y-%m-%d")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Internal helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _score_single(
-    ticker: str,
-    data_provider: DataProvider,
-    start_date: str,
-    end_date: str,
-) -> FactorScores:
-    """Compute all factor scores for a single ticker."""
-    try:
-        prices = data_provider.get_price_history(ticker, start_date, end_date)
-        fundamentals = data_provider.get_fundamentals(ticker)
-    except DataProviderError as e:
-        logger.warning(f"Data fetch failed for {ticker}: {e}")
-        return FactorScores(ticker, None, None, None)
-
-    return FactorScores(
-        ticker=ticker,
-        momentum=_compute_momentum(prices),
-        quality=_compute_quality(fundamentals),
-        low_vol=_compute_volatility(prices),
+def _optional(value: float) -> float | None:
+    """NaN → None, so missing factors look the same as in the scalar helpers."""
+    return None if math.isnan(value) else float(value)
+
+
+def _trailing_closes(closes: np.ndarray, n_rows: int) -> np.ndarray:
+    """
+    Last n_rows non-NaN values of each column, end-aligned and NaN-padded
+    at the front when a column has fewer.
+    """
+    # A stable sort on "is valid" moves each column's NaNs to the top
+    # while keeping its prices in date order
+    order = np.argsort(~np.isnan(closes), axis=0, kind="stable")
+    packed = np.take_along_axis(closes, order, axis=0)[-n_rows:]
+    if packed.shape[0] < n_rows:
+        padding = np.full((n_rows - packed.shape[0], packed.shape[1]), np.nan)
+        packed = np.vstack([padding, packed])
+    return packed
+
+
+def _factor_array(scores: list[FactorScores], name: str) -> np.ndarray:
+    """One factor as a float64 array (None → NaN), filled without an intermediate list."""
+    values = (getattr(s, name) for s in scores)
+    return np.fromiter(
+        (np.nan if v is None else v for v in values),
+        dtype=np.float64,
+        count=len(scores),
     )
 
 
+def _scored_count(momentum: np.ndarray, quality: np.ndarray, low_vol: np.ndarray) -> int:
+    """Number of positions where at least one factor is finite."""
+    scored = np.isfinite(momentum) | np.isfinite(quality) | np.isfinite(low_vol)
+    return int(np.count_nonzero(scored))
+
+
 def _compute_momentum(prices: pd.DataFrame) -> float | None:
     """
     12-1 month price momentum.
@@ -108,24 +298,18 @@ def _compute_momentum(prices: pd.DataFrame) -> float | None:
 
     Returns None if insufficient price history.
     """
-    close = prices["close"].dropna()
+    close = prices["close"].to_numpy(dtype=np.float64)
+    close = close[~np.isnan(close)]
 
-    if len(close) < MOMENTUM_LONG_WINDOW_DAYS:
+    if close.size < MOMENTUM_LONG_WINDOW_DAYS:
         return None
 
-    # Price at start of momentum window (~12 months ago)
-    price_12m_ago = close.iloc[-(MOMENTUM_LONG_WINDOW_DAYS)]
-
-    # Price at end of momentum window (~1 month ago, excluding recent reversal period)
-    price_1m_ago = close.iloc[-(MOMENTUM_SHORT_WINDOW_DAYS)]
-
-    if price_12m_ago <= 0:
-        return None
+    # NaN when the price ~12 months ago is non-positive
+    momentum = momentum_kernel(close, MOMENTUM_LONG_WINDOW_DAYS, MOMENTUM_SHORT_WINDOW_DAYS)
+    return None if math.isnan(momentum) else float(momentum)
 
-    return (price_1m_ago - price_12m_ago) / price_12m_ago
 
-
-def _compute_quality(fundamentals: dict) -> float | None:
+def _compute_quality(fundamentals: Fundamentals | dict) -> float | None:
     """
     Composite quality score combining ROE and debt-to-equity.
 
@@ -134,8 +318,9 @@ def _compute_quality(fundamentals: dict) -> float | None:
 
     Returns a single score; None if both inputs are unavailable.
     """
-    roe = fundamentals.get("return_on_equity")  # e.g. 0.35 = 35% ROE
-    dte = fundamentals.get("debt_to_equity")     # e.g. 1.5
+    fundamentals = Fundamentals.coerce(fundamentals)
+    roe = fundamentals.return_on_equity  # e.g. 0.35 = 35% ROE
+    dte = fundamentals.debt_to_equity    # e.g. 1.5
 
     if roe is None and dte is None:
         return None
@@ -161,25 +346,26 @@ def _compute_quality(fundamentals: dict) -> float | None:
 
 def _compute_volatility(prices: pd.DataFrame) -> float | None:
     """
-    Annualised realised volatility over the configured window.
+    Annualised realised volatility of daily log returns over the configured window.
 
     This is a RAW volatility value — Agent 6 inverts it so that
     lower volatility produces a higher composite score.
 
-    Returns None if insufficient price history.
+    Returns None if insufficient price history, or if a price in the
+    window is non-positive.
     """
-    close = prices["close"].dropna()
-
-    if len(close) < VOLATILITY_WINDOW_DAYS:
-        return None
+    close = prices["close"].to_numpy(dtype=np.float64)
+    close = close[~np.isnan(close)]
 
-    recent_close = close.iloc[-VOLATILITY_WINDOW_DAYS:]
-    daily_returns = recent_close.pct_change().dropna()
+    if VOLATILITY_WINDOW_DAYS <= 10:
+        raise ValueError(
+            f"VOLATILITY_WINDOW_DAYS must span at least 10 daily returns, "
+            f"got {VOLATILITY_WINDOW_DAYS}"
+        )
 
-    if len(daily_returns) < 10:
+    if close.size < VOLATILITY_WINDOW_DAYS:
         return None
 
-    # Annualise: multiply daily std by sqrt(252 trading days)
-    annualised_vol = daily_returns.std() * np.sqrt(252)
-
-    return float(annualised_vol)
+    # NaN when a price in the window is non-positive
+    vol = volatility_kernel(close, VOLATILITY_WINDOW_DAYS)
+    return None if math.isnan(vol) else float(vol)
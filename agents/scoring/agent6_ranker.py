@@ -17,15 +17,15 @@ import logging
 from dataclasses import dataclass, field
 
 import numpy as np
-import pandas as pd
 
-from agents.quant.agent5_factors import FactorScores
+from agents.quant.agent5_factors import FactorScores, FactorScoresBatch
 from config.settings import FACTOR_WEIGHTS, TOP_N_PER_SECTOR
+from utils.jit import HAS_NUMBA, njit
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RankedStock:
     """A single stock in the final ranked output."""
     ticker: str
@@ -37,14 +37,15 @@ class RankedStock:
 
 
 def rank_stocks(
-    factor_scores: list[FactorScores],
+    factor_scores: FactorScoresBatch | list[FactorScores],
     top_n: int | None = None,
 ) -> list[RankedStock]:
     """
     Normalise, weight, and rank stocks by composite factor score.
 
     Args:
-        factor_scores:  Output from Agent 5
+        factor_scores:  Output from Agent 5 (a FactorScoresBatch, or a
+                        list of per-ticker FactorScores)
         top_n:          Number of top stocks to return.
                         Defaults to TOP_N_PER_SECTOR from settings.
 
@@ -57,85 +58,160 @@ def rank_stocks(
         logger.warning("No factor scores provided to ranker")
         return []
 
-    # Build DataFrame for vectorised operations
-    df = pd.DataFrame([{
-        "ticker":   s.ticker,
-        "momentum": s.momentum,
-        "quality":  s.quality,
-        "low_vol":  s.low_vol,    # raw volatility — will be INVERTED below
-    } for s in factor_scores])
+    if not isinstance(factor_scores, FactorScoresBatch):
+        factor_scores = FactorScoresBatch.from_scores(factor_scores)
 
+    tickers  = factor_scores.tickers
+    momentum = factor_scores.momentum
+    quality  = factor_scores.quality
     # ── Step 1: Invert volatility so lower vol = higher score ────────────────
-    df["low_vol"] = df["low_vol"].apply(
-        lambda v: -v if v is not None else None
-    )
+    low_vol  = -factor_scores.low_vol
 
     # ── Step 2: Drop tickers with ALL factor scores missing ──────────────────
-    factor_cols = ["momentum", "quality", "low_vol"]
-    before = len(df)
-    df = df.dropna(subset=factor_cols, how="all")
-    dropped = before - len(df)
+    keep = ~(np.isnan(momentum) & np.isnan(quality) & np.isnan(low_vol))
+    dropped = len(tickers) - int(keep.sum())
     if dropped:
-        logger.warning(f"Dropped {dropped} tickers with no factor data")
+        logger.warning("Dropped %d tickers with no factor data", dropped)
+        tickers = [t for t, k in zip(tickers, keep) if k]
+        momentum, quality, low_vol = momentum[keep], quality[keep], low_vol[keep]
 
-    if df.empty:
+    if not tickers:
         logger.error("No scoreable stocks remaining after dropping nulls")
         return []
 
-    # ── Step 3: Cross-sectional z-score normalisation ────────────────────────
-    # Each factor is normalised within this universe so scores are comparable.
-    # Tickers with missing individual factors get a neutral score of 0.
-    for col in factor_cols:
-        col_z = col + "_z"
-        series = df[col].astype(float)
-        mean = series.mean(skipna=True)
-        std  = series.std(skipna=True)
-
-        if std == 0 or pd.isna(std):
-            # All values identical — assign neutral z-score
-            df[col_z] = 0.0
-        else:
-            df[col_z] = (series - mean) / std
-
-        # Fill remaining NaN (stocks missing this factor) with 0 (neutral)
-        df[col_z] = df[col_z].fillna(0.0)
-
-    # ── Step 4: Weighted composite score ────────────────────────────────────
-    w_mom = FACTOR_WEIGHTS["momentum"]
-    w_qua = FACTOR_WEIGHTS["quality"]
-    w_vol = FACTOR_WEIGHTS["low_vol"]
-
-    df["composite_score"] = (
-        w_mom * df["momentum_z"] +
-        w_qua * df["quality_z"]  +
-        w_vol * df["low_vol_z"]
-    )
-
-    # ── Step 5: Rank and return top N ────────────────────────────────────────
-    df = df.sort_values("composite_score", ascending=False).reset_index(drop=True)
-    df["rank"] = df.index + 1
-
-    top = df.head(n)
+    # ── Steps 3-5: z-scores, weighted composite, best n first ────────────────
+    weights = np.array([
+        FACTOR_WEIGHTS["momentum"],
+        FACTOR_WEIGHTS["quality"],
+        FACTOR_WEIGHTS["low_vol"],
+    ], dtype=np.float64)
+    z, composite = _rank(momentum, quality, low_vol, weights)
+    top = _top_k(composite, n)
+
+    # Pull the top rows out as plain Python floats in one go, then build by position
+    top_tickers = [tickers[i] for i in top]
+    comps = composite[top].tolist()
+    mz, qz, vz = z[top].T.tolist()
 
     results = [
         RankedStock(
-            ticker          = row["ticker"],
-            composite_score = round(row["composite_score"], 4),
-            momentum_z      = round(row["momentum_z"],      4),
-            quality_z       = round(row["quality_z"],       4),
-            low_vol_z       = round(row["low_vol_z"],       4),
-            rank            = row["rank"],
+            ticker          = top_tickers[i],
+            composite_score = round(comps[i], 4),
+            momentum_z      = round(mz[i],    4),
+            quality_z       = round(qz[i],    4),
+            low_vol_z       = round(vz[i],    4),
+            rank            = i + 1,
         )
-        for _, row in top.iterrows()
+        for i in range(len(top))
     ]
 
     for r in results:
         logger.info(
-            f"Rank {r.rank}: {r.ticker} "
-            f"(composite={r.composite_score:.3f}, "
-            f"mom={r.momentum_z:.3f}, "
-            f"qual={r.quality_z:.3f}, "
-            f"vol={r.low_vol_z:.3f})"
+            "Rank %d: %s (composite=%.3f, mom=%.3f, qual=%.3f, vol=%.3f)",
+            r.rank, r.ticker, r.composite_score, r.momentum_z, r.quality_z, r.low_vol_z,
         )
 
     return results
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Internal helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+@njit(cache=True)
+def _rank_kernel(mom, qual, vol, w):
+    """
+    Cross-sectional z-scores and weighted composite.
+
+    Each factor is normalised within this universe so scores are comparable.
+    Mean and sample std come from a single Welford pass that skips NaN.
+    Stocks missing a factor, or factors with zero/undefined spread,
+    get a neutral z-score of 0.
+
+    Returns:
+        z:         (N, 3) z-scores for momentum, quality, low_vol
+        composite: (N,) weighted sum of z
+    """
+    n = mom.shape[0]
+    cols = np.empty((n, 3))
+    cols[:, 0] = mom
+    cols[:, 1] = qual
+    cols[:, 2] = vol
+
+    z = np.zeros((n, 3))
+    for j in range(3):
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n):
+            x = cols[i, j]
+            if not np.isnan(x):
+                count += 1
+                delta = x - mean
+                mean += delta / count
+                m2 += delta * (x - mean)
+
+        if count < 2:
+            continue
+        std = np.sqrt(m2 / (count - 1))
+        if std == 0.0:
+            # All values identical — leave neutral z-scores
+            continue
+
+        for i in range(n):
+            x = cols[i, j]
+            if not np.isnan(x):
+                z[i, j] = (x - mean) / std
+
+    composite = np.zeros(n)
+    for i in range(n):
+        for j in range(3):
+            composite[i] += w[j] * z[i, j]
+
+    return z, composite
+
+
+def _rank_numpy(mom, qual, vol, w):
+    """
+    NumPy equivalent of _rank_kernel, used when numba is unavailable —
+    the kernel's element loops would otherwise run interpreted.
+    """
+    mat = np.column_stack((mom, qual, vol))
+    valid = ~np.isnan(mat)
+    count = valid.sum(axis=0)
+
+    # Column statistics over the present values only, as one (N, 3) op
+    mean = np.where(valid, mat, 0.0).sum(axis=0) / np.maximum(count, 1)
+    dev = np.where(valid, mat - mean, 0.0)
+    std = np.sqrt((dev * dev).sum(axis=0) / np.maximum(count - 1, 1))
+
+    # Spread checked exactly: a two-pass std of identical values can come
+    # out as ~1e-17 rather than 0
+    spread = np.where(valid, mat, -np.inf).max(axis=0) > np.where(valid, mat, np.inf).min(axis=0)
+    usable = (count >= 2) & spread
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(valid & usable, dev / std, 0.0)
+    return z, z @ w
+
+
+_rank = _rank_kernel if HAS_NUMBA else _rank_numpy
+
+
+def _top_k(composite: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest composite scores, best first.
+
+    argpartition finds the k-th best score in O(N); only the scores at or
+    above it are then sorted. When every stock is kept there is nothing to
+    select, so a single stable sort is used instead. Ties are ordered by
+    input position either way.
+    """
+    if k >= composite.shape[0]:
+        return np.argsort(-composite, kind="stable")
+
+    # argpartition picks arbitrarily among scores tied with the k-th best,
+    # so keep every tied candidate and let the sort settle them by position
+    kth_best = composite[np.argpartition(-composite, k - 1)[k - 1]]
+    top = np.flatnonzero(composite >= kth_best)
+    return top[np.lexsort((top, -composite[top]))][:k]
@@ -7,21 +7,29 @@
 # but you'll flesh out the portfolio tracking once Agent 7 is wired in.
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 
 import pandas as pd
 
-from data.base_provider import DataProvider
-from agents.agent4_screener import screen_universe
-from agents.agent5_factors import compute_factor_scores
-from agents.agent6_ranker import rank_stocks, RankedStock
-from config.settings import BACKTEST_START_DATE, BACKTEST_END_DATE, REBALANCE_FREQUENCY
+from data.skeleton.base_provider import DataProvider
+from data.skeleton.in_memory_provider import SlicedProvider
+from agents.quant.agent4_screener import screen_universe
+from agents.quant.agent5_factors import compute_factor_scores, lookback_start_date
+from agents.scoring.agent6_ranker import rank_stocks, RankedStock
+from config.settings import (
+    BACKTEST_START_DATE,
+    BACKTEST_END_DATE,
+    REBALANCE_FREQUENCY,
+    BACKTEST_MAX_WORKERS,
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestSnapshot:
     """State of the portfolio at a single rebalance date."""
     date: str
@@ -31,7 +39,7 @@ class BacktestSnapshot:
     # TODO: add forward returns, portfolio weights, P&L once Agent 7 is integrated
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     """Aggregated results across the full backtest period."""
     sector: str
@@ -54,6 +62,7 @@ def run_backtest(
     start_date: str | None = None,
     end_date: str | None = None,
     frequency: str | None = None,
+    max_workers: int | None = None,
 ) -> BacktestResult:
     """
     Run a historical backtest of the quant engine for a given sector.
@@ -64,6 +73,8 @@ def run_backtest(
         start_date:     'YYYY-MM-DD', defaults to settings
         end_date:       'YYYY-MM-DD', defaults to settings
         frequency:      pandas offset alias ('D', 'W', 'M'), defaults to settings
+        max_workers:    worker processes for the rebalance loop,
+                        defaults to settings (then CPU count)
 
     Returns:
         BacktestResult with snapshot history
@@ -72,28 +83,58 @@ def run_backtest(
     end    = end_date   or BACKTEST_END_DATE
     freq   = frequency  or REBALANCE_FREQUENCY
 
-    logger.info(f"Starting backtest: {sector} | {start} → {end} | freq={freq}")
+    logger.info("Starting backtest: %s | %s → %s | freq=%s", sector, start, end, freq)
 
     result = BacktestResult(sector=sector, start_date=start, end_date=end)
 
-    # Generate rebalance dates
-    rebalance_dates = pd.date_range(start=start, end=end, freq=freq)
-    logger.info(f"{len(rebalance_dates)} rebalance periods")
+    # Download the full price window and fundamentals once; each period then
+    # reads them from memory
+    tickers = data_provider.get_tickers_for_sector(sector)
+    data_provider = SlicedProvider.prefetch(
+        data_provider, tickers, lookback_start_date(start), end,
+    )
+
+    # Generate rebalance dates, formatted once up front
+    rebalance_dates = pd.date_range(start=start, end=end, freq=freq).strftime("%Y-%m-%d").tolist()
+    logger.info("%d rebalance periods", len(rebalance_dates))
+
+    # Periods are independent given the prefetched data, so fan them out.
+    # The provider is shipped to each worker once, not pickled per task.
+    with ProcessPoolExecutor(
+        max_workers=max_workers or BACKTEST_MAX_WORKERS or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(data_provider,),
+    ) as executor:
+        futures = {
+            executor.submit(_run_period_in_worker, sector, date_str): date_str
+            for date_str in rebalance_dates
+        }
+        for future in as_completed(futures):
+            date_str = futures[future]
+            try:
+                result.snapshots.append(future.result())
+            except Exception as e:
+                # Log and continue — don't let one bad date break the whole backtest
+                logger.warning("Period %s failed: %s", date_str, e)
+
+    result.snapshots.sort(key=lambda s: s.date)
+
+    logger.info("Backtest complete: %d successful periods", len(result.snapshots))
+    return result
 
-    for date in rebalance_dates:
-        date_str = date.strftime("%Y-%m-%d")
-        logger.debug(f"Processing {date_str}...")
 
-        try:
-            snapshot = _run_single_period(sector, data_provider, date_str)
-            result.snapshots.append(snapshot)
-        except Exception as e:
-            # Log and continue — don't let one bad date break the whole backtest
-            logger.warning(f"Period {date_str} failed: {e}")
-            continue
+# Per-process provider set by the pool initializer
+_worker_provider: DataProvider | None = None
 
-    logger.info(f"Backtest complete: {len(result.snapshots)} successful periods")
-    return result
+
+def _init_worker(data_provider: DataProvider) -> None:
+    global _worker_provider
+    _worker_provider = data_provider
+
+
+def _run_period_in_worker(sector: str, as_of_date: str) -> BacktestSnapshot:
+    logger.debug("Processing %s...", as_of_date)
+    return _run_single_period(sector, _worker_provider, as_of_date)
 
 
 def _run_single_period(
@@ -105,7 +146,7 @@ def _run_single_period(
 
     # Agent 4
     raw_tickers = data_provider.get_tickers_for_sector(sector)
-    passed, _ = screen_universe(raw_tickers, data_provider)
+    passed = screen_universe(raw_tickers, data_provider, return_reasons=False)
 
     # Agent 5
     factor_scores = compute_factor_scores(passed, data_provider, as_of_date=as_of_date)
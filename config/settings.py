@@ -66,3 +66,15 @@ TOP_N_PER_SECTOR = 3
 BACKTEST_START_DATE = "2019-01-01"
 BACKTEST_END_DATE   = "2023-12-31"
 REBALANCE_FREQUENCY = "D"   # 'D' daily, 'W' weekly, 'M' monthly
+
+# Worker processes for the rebalance loop — None uses every CPU core
+BACKTEST_MAX_WORKERS = None
+
+
+# ─────────────────────────────────────────
+# Data caching
+# ─────────────────────────────────────────
+
+# On-disk memo of fetched fundamentals and price histories (see utils/memo.py)
+MEMO_CACHE_PATH = ".cache/quant.sqlite"
+MEMO_TTL_SECONDS = 86_400   # 1 day — stale entries are refetched
@@ -4,8 +4,33 @@
 # To swap providers: write a new class that inherits DataProvider, swap in main.py.
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import NamedTuple
+
 import pandas as pd
 
+
+class Fundamentals(NamedTuple):
+    """Point-in-time fundamentals for one ticker. None where unavailable."""
+    market_cap:         float | None   # total market capitalisation in USD
+    avg_daily_volume:   float | None   # average daily dollar volume (20-day)
+    debt_to_equity:     float | None   # total debt / total equity
+    return_on_equity:   float | None   # net income / shareholders equity (TTM)
+    earnings_per_share: float | None   # diluted EPS (TTM)
+    price:              float | None   # latest close price
+
+    @classmethod
+    def coerce(cls, value: "Fundamentals | Mapping") -> "Fundamentals":
+        """Accept a Fundamentals or a dict using the same keys (missing keys → None)."""
+        if isinstance(value, cls):
+            return value
+        return cls(*(value.get(f) for f in cls._fields))
+
+
+# Field names of Fundamentals, in schema order
+FUNDAMENTAL_FIELDS = list(Fundamentals._fields)
+
+
 class DataProvider(ABC):
     """
     Contract that every data provider must fulfil.
@@ -39,12 +64,42 @@ class DataProvider(ABC):
         """
         ...
 
+    def get_price_history_batch(
+        self,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Returns daily OHLCV data for several tickers at once.
+
+        Default implementation loops over get_price_history. Providers whose
+        backend supports multi-symbol requests should override this to fetch
+        the whole list in a single round trip.
+
+        Args:
+            tickers:    e.g. ['AAPL', 'MSFT']
+            start_date: 'YYYY-MM-DD'
+            end_date:   'YYYY-MM-DD'
+
+        Returns:
+            dict of ticker → DataFrame (same schema as get_price_history).
+            Tickers whose data is unavailable are omitted.
+        """
+        histories = {}
+        for ticker in tickers:
+            try:
+                histories[ticker] = self.get_price_history(ticker, start_date, end_date)
+            except DataProviderError:
+                continue
+        return histories
+
     @abstractmethod
-    def get_fundamentals(self, ticker: str) -> dict:
+    def get_fundamentals(self, ticker: str) -> Fundamentals:
         """
         Returns latest point-in-time fundamental metrics.
 
-        Expected keys (all float, None if unavailable):
+        Expected fields (all float, None if unavailable):
             market_cap          — total market capitalisation in USD
             avg_daily_volume    — average daily dollar volume (20-day)
             debt_to_equity      — total debt / total equity
@@ -56,13 +111,28 @@ class DataProvider(ABC):
             ticker: e.g. 'AAPL'
 
         Returns:
-            dict with keys above
+            Fundamentals with the fields above. A plain dict with the same
+            keys is still accepted by the agents (see Fundamentals.coerce).
 
         Raises:
             DataProviderError if data unavailable
         """
         ...
 
+    def prefetch_fundamentals(self, tickers: list[str]) -> None:
+        """
+        Optional hook: warm any internal cache for a batch of tickers so that
+        subsequent get_fundamentals calls are served from memory.
+
+        Default implementation does nothing. Providers where per-ticker
+        fetches are expensive should override this. It must never raise —
+        tickers that fail here raise from get_fundamentals as usual.
+
+        Args:
+            tickers: e.g. ['AAPL', 'MSFT']
+        """
+        return None
+
     @abstractmethod
     def get_tickers_for_sector(self, sector: str) -> list[str]:
         """
@@ -79,6 +149,36 @@ class DataProvider(ABC):
         """
         ...
 
+    def get_sector_snapshot(self, sector: str) -> pd.DataFrame:
+        """
+        Returns fundamentals for a sector's whole universe in one call.
+
+        Default implementation warms prefetch_fundamentals for the sector's
+        tickers, then reads them one by one. Providers with a bulk quote
+        endpoint should override this to fetch the universe in one request.
+
+        Args:
+            sector: e.g. 'Technology', 'Healthcare' — GICS sector names
+
+        Returns:
+            DataFrame indexed by ticker with FUNDAMENTAL_FIELDS columns, in
+            get_tickers_for_sector order (NaN/None where a field is missing).
+            Tickers whose fundamentals are unavailable are omitted.
+
+        Raises:
+            DataProviderError if sector unknown
+        """
+        tickers = self.get_tickers_for_sector(sector)
+        self.prefetch_fundamentals(tickers)
+
+        rows = {}
+        for ticker in tickers:
+            try:
+                rows[ticker] = Fundamentals.coerce(self.get_fundamentals(ticker))
+            except DataProviderError:
+                continue
+        return pd.DataFrame(list(rows.values()), index=list(rows), columns=FUNDAMENTAL_FIELDS)
+
 
 class DataProviderError(Exception):
     """Raised when a data provider cannot fulfil a request."""
@@ -0,0 +1,177 @@
+# data/in_memory_provider.py
+# DataProviders that serve pre-fetched data from memory.
+# Used by the backtester so each rebalance date slices one up-front download
+# instead of going back to the network, and by main.py so Agents 4 and 5
+# share one concurrent fundamentals fetch.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from data.skeleton.base_provider import (
+    DataProvider,
+    DataProviderError,
+    Fundamentals,
+    FUNDAMENTAL_FIELDS,
+)
+
+
+def download_fundamentals(
+    provider: DataProvider,
+    tickers: list[str],
+    threads: int = 16,
+) -> dict[str, Fundamentals | DataProviderError]:
+    """
+    Fetch fundamentals for many tickers concurrently.
+
+    Per-ticker fetches are network-bound, so overlapping them across a
+    thread pool turns N round trips into roughly N / threads.
+
+    Returns:
+        dict of ticker → Fundamentals, in tickers order. A ticker whose
+        fetch failed maps to its DataProviderError instead, so the failure
+        can be re-raised (with its original message) at lookup time.
+    """
+    def fetch(ticker: str) -> Fundamentals | DataProviderError:
+        try:
+            return Fundamentals.coerce(provider.get_fundamentals(ticker))
+        except DataProviderError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return dict(zip(tickers, executor.map(fetch, tickers)))
+
+
+class SlicedProvider(DataProvider):
+    """
+    Wraps another DataProvider with a pre-fetched price history per ticker.
+
+    get_price_history slices the in-memory frame; fundamentals and sector
+    universes are fetched from the wrapped provider once and reused thereafter.
+    Holds only plain DataFrames and dicts, so instances are picklable.
+    """
+
+    def __init__(self, inner: DataProvider, price_frames: dict[str, pd.DataFrame]):
+        self._inner = inner
+        self._prices = price_frames
+        # The wrapped provider only exposes a latest snapshot of fundamentals,
+        # so one fetch per ticker is valid for every date in a run.
+        self._fundamentals: dict[str, Fundamentals] = {}
+        # Sector universes are fixed for the lifetime of a backtest run
+        self._sector_tickers: dict[str, list[str]] = {}
+
+    @classmethod
+    def prefetch(
+        cls,
+        inner: DataProvider,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> "SlicedProvider":
+        """
+        Download the full [start_date, end_date) price range and the
+        fundamentals for all tickers up front.
+
+        Fundamentals are fetched here rather than lazily so that copies of
+        this provider sent to worker processes start with a warm cache.
+        The wrapped provider's prefetch_fundamentals hook runs first, so a
+        provider that batches or overlaps fetches does so for the whole run.
+        """
+        provider = cls(inner, inner.get_price_history_batch(tickers, start_date, end_date))
+        inner.prefetch_fundamentals(tickers)
+        for ticker in tickers:
+            try:
+                provider.get_fundamentals(ticker)
+            except DataProviderError:
+                continue  # surfaced again, per period, when screening asks for it
+        return provider
+
+    def get_price_history(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+    ) -> pd.DataFrame:
+        if ticker not in self._prices:
+            return self._inner.get_price_history(ticker, start_date, end_date)
+
+        # Same half-open [start, end) window as a live download
+        df = self._prices[ticker]
+        lo = df.index.searchsorted(pd.Timestamp(start_date), side="left")
+        hi = df.index.searchsorted(pd.Timestamp(end_date), side="left")
+        return df.iloc[lo:hi]
+
+    def get_price_history_batch(
+        self,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, pd.DataFrame]:
+        # Slice what we hold; fetch the rest from the wrapped provider in one batch
+        missing = [t for t in tickers if t not in self._prices]
+        fetched = (
+            self._inner.get_price_history_batch(missing, start_date, end_date)
+            if missing else {}
+        )
+        histories = {}
+        for ticker in tickers:
+            if ticker in self._prices:
+                histories[ticker] = self.get_price_history(ticker, start_date, end_date)
+            elif ticker in fetched:
+                histories[ticker] = fetched[ticker]
+        return histories
+
+    def get_fundamentals(self, ticker: str) -> Fundamentals:
+        if ticker not in self._fundamentals:
+            self._fundamentals[ticker] = Fundamentals.coerce(self._inner.get_fundamentals(ticker))
+        return self._fundamentals[ticker]
+
+    def get_tickers_for_sector(self, sector: str) -> list[str]:
+        if sector not in self._sector_tickers:
+            self._sector_tickers[sector] = self._inner.get_tickers_for_sector(sector)
+        return list(self._sector_tickers[sector])
+
+
+class DictProvider(SlicedProvider):
+    """
+    Serves pre-fetched fundamentals (see download_fundamentals) and,
+    optionally, pre-fetched price histories.
+
+    Anything not pre-fetched is delegated to the wrapped provider, so this
+    can stand in for it across the whole pipeline.
+    """
+
+    def __init__(
+        self,
+        inner: DataProvider,
+        fundamentals: dict[str, Fundamentals | DataProviderError],
+        price_frames: dict[str, pd.DataFrame] | None = None,
+    ):
+        super().__init__(inner, price_frames or {})
+        self._fundamentals = fundamentals
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        inner: DataProvider,
+        snapshot: pd.DataFrame,
+        price_frames: dict[str, pd.DataFrame] | None = None,
+    ) -> "DictProvider":
+        """
+        Build from a get_sector_snapshot frame. Tickers absent from the
+        snapshot raise DataProviderError from get_fundamentals.
+        """
+        rows = snapshot.reindex(columns=FUNDAMENTAL_FIELDS).itertuples(index=False)
+        fundamentals = {
+            ticker: Fundamentals(*(None if pd.isna(v) else float(v) for v in row))
+            for ticker, row in zip(snapshot.index, rows)
+        }
+        return cls(inner, fundamentals, price_frames)
+
+    def get_fundamentals(self, ticker: str) -> Fundamentals:
+        if ticker not in self._fundamentals:
+            raise DataProviderError(f"No pre-fetched fundamentals for {ticker}")
+        value = self._fundamentals[ticker]
+        if isinstance(value, DataProviderError):
+            raise value
+        return value
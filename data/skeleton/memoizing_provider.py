@@ -0,0 +1,83 @@
+# data/memoizing_provider.py
+# DataProvider wrapper that memoizes fetches on disk.
+# Repeat runs on the same date — and sectors sharing tickers — read from the
+# memo table instead of refetching from the wrapped provider.
+
+import pandas as pd
+
+from data.skeleton.base_provider import DataProvider, Fundamentals
+from utils.memo import DiskMemo
+
+
+class MemoizingProvider(DataProvider):
+    """
+    Wraps another DataProvider with a DiskMemo in front of its fetches.
+
+    Fundamentals are keyed on (ticker, as_of_date). The key only scopes the
+    cache to a run date: the wrapped provider still returns its latest
+    snapshot, so a historical as_of_date stores today's fundamentals under
+    that date. Price histories are keyed on (ticker, start_date, end_date).
+
+    Failed fetches are not memoized. Sector lookups are delegated as-is.
+    """
+
+    def __init__(self, inner: DataProvider, memo: DiskMemo, as_of_date: str):
+        self._inner = inner
+        self._memo = memo
+        self._as_of_date = as_of_date
+
+    def get_price_history(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+    ) -> pd.DataFrame:
+        key = ("prices", ticker, start_date, end_date)
+        df = self._memo.lookup(key)
+        if df is DiskMemo.MISSING:
+            df = self._inner.get_price_history(ticker, start_date, end_date)
+            self._memo.update(key, df)
+        return df
+
+    def get_price_history_batch(
+        self,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, pd.DataFrame]:
+        # Serve memoized tickers; fetch the rest in one batch from the wrapped provider
+        cached = {t: self._memo.lookup(("prices", t, start_date, end_date)) for t in tickers}
+        missing = [t for t, df in cached.items() if df is DiskMemo.MISSING]
+        fetched = (
+            self._inner.get_price_history_batch(missing, start_date, end_date)
+            if missing else {}
+        )
+        for ticker, df in fetched.items():
+            self._memo.update(("prices", ticker, start_date, end_date), df)
+
+        histories = {}
+        for ticker in tickers:
+            if cached[ticker] is not DiskMemo.MISSING:
+                histories[ticker] = cached[ticker]
+            elif ticker in fetched:
+                histories[ticker] = fetched[ticker]
+        return histories
+
+    def get_fundamentals(self, ticker: str) -> Fundamentals:
+        key = ("fundamentals", ticker, self._as_of_date)
+        fundamentals = self._memo.lookup(key)
+        if fundamentals is DiskMemo.MISSING:
+            fundamentals = Fundamentals.coerce(self._inner.get_fundamentals(ticker))
+            self._memo.update(key, fundamentals)
+        return fundamentals
+
+    def prefetch_fundamentals(self, tickers: list[str]) -> None:
+        missing = [
+            t for t in tickers
+            if self._memo.lookup(("fundamentals", t, self._as_of_date)) is DiskMemo.MISSING
+        ]
+        if missing:
+            self._inner.prefetch_fundamentals(missing)
+
+    def get_tickers_for_sector(self, sector: str) -> list[str]:
+        return self._inner.get_tickers_for_sector(sector)
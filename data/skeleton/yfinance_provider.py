@@ -4,9 +4,29 @@
 # When your friend lands on a production provider (FMP, Polygon etc.),
 # write a new class inheriting DataProvider and swap this out in main.py.
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
+
+import requests
 import yfinance as yf
 import pandas as pd
-from data.skeleton.base_provider import DataProvider, DataProviderError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # yfinance's own HTTP backend; impersonates a browser's TLS fingerprint
+    from curl_cffi import requests as curl_requests
+except ImportError:  # pragma: no cover — yfinance then falls back to requests too
+    curl_requests = None
+
+from data.skeleton.base_provider import (
+    DataProvider,
+    DataProviderError,
+    Fundamentals,
+    FUNDAMENTAL_FIELDS,
+)
+from data.skeleton.in_memory_provider import download_fundamentals
 
 # Hardcoded sector → tickers map for prototyping.
 # In production this will come from your data provider's universe endpoint.
@@ -34,6 +54,29 @@ SECTOR_TICKERS = {
 }
 
 
+# Concurrent .info requests issued by prefetch_fundamentals
+FUNDAMENTALS_FETCH_THREADS = 16
+
+# Symbols per yf.download request, and how many of those requests run at once
+PRICE_BATCH_SIZE = 20
+PRICE_BATCH_THREADS = 5
+
+# Connections kept open to Yahoo by the requests fallback session — must
+# cover FUNDAMENTALS_FETCH_THREADS (curl_cffi keeps one handle per thread)
+HTTP_POOL_SIZE = 32
+
+# Browser headers for the requests fallback, as yfinance sets on its own
+# fallback session; Yahoo throttles the default python-requests User-Agent
+_FALLBACK_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+
 class YFinanceProvider(DataProvider):
     """
     yfinance-backed DataProvider.
@@ -41,6 +84,31 @@ class YFinanceProvider(DataProvider):
     Not suitable for production — replace before live trading.
     """
 
+    def __init__(self, session: Any | None = None):
+        """
+        Args:
+            session: Shared HTTP session (see build_session). Pass one in to
+                     reuse its connection pool across providers; defaults to
+                     a new session owned by this provider.
+        """
+        # One keep-alive connection pool for every yfinance call this provider makes
+        self._session = session or build_session()
+        # Filled by prefetch_fundamentals; one row per ticker, FUNDAMENTAL_FIELDS columns
+        self._fundamentals_df: pd.DataFrame | None = None
+        # Tickers whose prefetch failed, re-raised rather than fetched again
+        self._fundamentals_errors: dict[str, DataProviderError] = {}
+
+    def __getstate__(self) -> dict:
+        # curl_cffi sessions hold thread-local handles and can't be pickled;
+        # a copy sent to a worker process builds its own session instead
+        state = self.__dict__.copy()
+        del state["_session"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._session = build_session()
+
     def get_price_history(
         self,
         ticker: str,
@@ -54,6 +122,7 @@ class YFinanceProvider(DataProvider):
                 end=end_date,
                 auto_adjust=True,
                 progress=False,
+                session=self._session,
             )
         except Exception as e:
             raise DataProviderError(f"yfinance failed for {ticker}: {e}")
@@ -61,16 +130,118 @@ class YFinanceProvider(DataProvider):
         if raw.empty:
             raise DataProviderError(f"No price data returned for {ticker}")
 
-        # Normalise column names to lowercase
-        df = raw[["Open", "High", "Low", "Close", "Volume"]].copy()
-        df.columns = ["open", "high", "low", "close", "volume"]
-        df.index.name = "date"
+        return _normalise_ohlcv(raw)
+
+    def get_price_history_batch(
+        self,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, pd.DataFrame]:
+        # One yf.download per PRICE_BATCH_SIZE symbols instead of one HTTP
+        # round trip per ticker; the chunked downloads run concurrently
+        if not tickers:
+            return {}
+
+        chunks = [
+            tickers[i:i + PRICE_BATCH_SIZE]
+            for i in range(0, len(tickers), PRICE_BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            return self._download_chunk(chunks[0], start_date, end_date)
+
+        def fetch(chunk: list[str]) -> dict[str, pd.DataFrame] | DataProviderError:
+            try:
+                return self._download_chunk(chunk, start_date, end_date)
+            except DataProviderError as e:
+                return e
 
-        return df
+        with ThreadPoolExecutor(max_workers=min(PRICE_BATCH_THREADS, len(chunks))) as executor:
+            results = list(executor.map(fetch, chunks))
 
-    def get_fundamentals(self, ticker: str) -> dict:
+        errors = [r for r in results if isinstance(r, DataProviderError)]
+        if len(errors) == len(results):
+            raise errors[0]
+
+        # A failed chunk's tickers are omitted, like any other unavailable ticker
+        histories = {}
+        for result in results:
+            if not isinstance(result, DataProviderError):
+                histories.update(result)
+        return histories
+
+    def _download_chunk(
+        self,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, pd.DataFrame]:
         try:
-            info = yf.Ticker(ticker).info
+            raw = yf.download(
+                " ".join(tickers),
+                start=start_date,
+                end=end_date,
+                auto_adjust=True,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                session=self._session,
+            )
+        except Exception as e:
+            raise DataProviderError(f"yfinance batch download failed for {tickers}: {e}")
+
+        if raw.empty:
+            return {}
+
+        histories = {}
+        for ticker in tickers:
+            if ticker not in raw.columns.get_level_values(0):
+                continue
+            df = _normalise_ohlcv(raw[ticker]).dropna(how="all")
+            if not df.empty:
+                histories[ticker] = df
+
+        return histories
+
+    def prefetch_fundamentals(self, tickers: list[str]) -> None:
+        # yfinance .info has no server-side batch endpoint, so overlap the
+        # per-ticker requests instead of issuing them one after another.
+        # Earlier failures for these tickers are forgotten first, so the
+        # download retries them rather than re-raising the cached error.
+        for ticker in tickers:
+            self._fundamentals_errors.pop(ticker, None)
+        fetched = download_fundamentals(self, tickers, threads=FUNDAMENTALS_FETCH_THREADS)
+
+        rows = {}
+        for ticker, result in fetched.items():
+            if isinstance(result, DataProviderError):
+                self._fundamentals_errors[ticker] = result
+            else:
+                rows[ticker] = result
+        if not rows:
+            return
+
+        new = pd.DataFrame(list(rows.values()), index=list(rows), columns=FUNDAMENTAL_FIELDS)
+        if self._fundamentals_df is None:
+            self._fundamentals_df = new
+        else:
+            self._fundamentals_df = pd.concat([
+                self._fundamentals_df.drop(index=new.index, errors="ignore"),
+                new,
+            ])
+
+    def get_fundamentals(self, ticker: str) -> Fundamentals:
+        if ticker in self._fundamentals_errors:
+            raise self._fundamentals_errors[ticker]
+        if self._fundamentals_df is not None and ticker in self._fundamentals_df.index:
+            row = self._fundamentals_df.loc[ticker].tolist()
+            # The frame stores missing values as NaN; agents expect None
+            return Fundamentals(*(None if pd.isna(v) else float(v) for v in row))
+        return self._fetch_fundamentals(ticker)
+
+    def _fetch_fundamentals(self, ticker: str) -> Fundamentals:
+        try:
+            info = yf.Ticker(ticker, session=self._session).info
         except Exception as e:
             raise DataProviderError(f"yfinance fundamentals failed for {ticker}: {e}")
 
@@ -79,19 +250,82 @@ class YFinanceProvider(DataProvider):
 
         # Map yfinance keys to our standard schema
         # Some fields may be None — agents must handle this gracefully
-        return {
-            "market_cap":        info.get("marketCap"),
-            "avg_daily_volume":  info.get("averageDailyVolume10Day"),
-            "debt_to_equity":    info.get("debtToEquity"),
-            "return_on_equity":  info.get("returnOnEquity"),
-            "earnings_per_share": info.get("trailingEps"),
-            "price":             info.get("currentPrice") or info.get("regularMarketPrice"),
-        }
+        return Fundamentals(
+            market_cap         = info.get("marketCap"),
+            avg_daily_volume   = info.get("averageDailyVolume10Day"),
+            debt_to_equity     = info.get("debtToEquity"),
+            return_on_equity   = info.get("returnOnEquity"),
+            earnings_per_share = info.get("trailingEps"),
+            price              = info.get("currentPrice") or info.get("regularMarketPrice"),
+        )
 
     def get_tickers_for_sector(self, sector: str) -> list[str]:
-        if sector not in SECTOR_TICKERS:
-            raise DataProviderError(
-                f"Unknown sector '{sector}'. "
-                f"Available: {list(SECTOR_TICKERS.keys())}"
-            )
-        return SECTOR_TICKERS[sector]
+        # Copy so callers can't mutate the cached universe
+        return list(_sector_tickers(sector))
+
+    def get_sector_snapshot(self, sector: str) -> pd.DataFrame:
+        # yfinance has no bulk quote endpoint either, so the snapshot is the
+        # concurrent prefetch, read straight out of the frame it fills
+        tickers = self.get_tickers_for_sector(sector)
+        self.prefetch_fundamentals(tickers)
+        if self._fundamentals_df is None:
+            return pd.DataFrame(columns=FUNDAMENTAL_FIELDS)
+        return self._fundamentals_df.reindex(
+            [t for t in tickers if t in self._fundamentals_df.index]
+        )
+
+
+@lru_cache(maxsize=32)
+def _sector_tickers(sector: str) -> tuple[str, ...]:
+    """
+    Sector universe lookup, cached per sector.
+
+    A plain dict read here, but a universe endpoint call for a production
+    provider — key that cache on (sector, as_of year, as_of month) so
+    point-in-time universes stay correct without a fetch per rebalance.
+    """
+    if sector not in SECTOR_TICKERS:
+        raise DataProviderError(
+            f"Unknown sector '{sector}'. "
+            f"Available: {list(SECTOR_TICKERS.keys())}"
+        )
+    return tuple(SECTOR_TICKERS[sector])
+
+
+def _normalise_ohlcv(raw: pd.DataFrame) -> pd.DataFrame:
+    """Select OHLCV from a yfinance frame and lowercase the column names."""
+    df = raw[["Open", "High", "Low", "Close", "Volume"]].copy()
+    df.columns = ["open", "high", "low", "close", "volume"]
+    df.index.name = "date"
+    return df
+
+
+def build_session() -> Any:
+    """
+    HTTP session for every yfinance call, on the backend yfinance itself uses.
+
+    With curl_cffi (a yfinance dependency) this is a Chrome-impersonating
+    session, as yfinance builds by default, retrying failed connections with
+    backoff. Rate-limit responses are not retried — that only prolongs the
+    block. Without curl_cffi it is a pooled requests session carrying
+    browser headers, retrying transient 5xx errors.
+    """
+    if curl_requests is not None:
+        return curl_requests.Session(
+            impersonate="chrome",
+            retry=curl_requests.RetryStrategy(count=3, delay=0.3, backoff="exponential"),
+        )
+
+    session = requests.Session()
+    session.headers.update(_FALLBACK_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
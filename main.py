@@ -7,23 +7,89 @@
 #   python main.py --sector Technology --date 2023-06-01
 
 import argparse
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import pandas as pd
+
+from data.skeleton.base_provider import DataProvider, DataProviderError
 from data.skeleton.yfinance_provider import YFinanceProvider
+from data.skeleton.in_memory_provider import DictProvider
+from data.skeleton.memoizing_provider import MemoizingProvider
 from agents.quant.agent4_screener import screen_universe
-from agents.quant.agent5_factors import compute_factor_scores
+from agents.quant.agent5_factors import compute_factor_scores, lookback_start_date
 from agents.scoring.agent6_ranker import rank_stocks
+from config.settings import MEMO_CACHE_PATH, MEMO_TTL_SECONDS
+from utils.memo import DiskMemo
 
 # ── Logging setup ─────────────────────────────────────────────────────────────
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders asctime at most once per second.
+
+    The date format has one-second resolution, so every record logged within
+    the same second reuses the previous strftime result.
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        self._cached_time = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._cached_time = (second, text)  # one tuple, so threads never see a torn pair
+        return text
+
+
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(_CachedTimeFormatter(
+    "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     datefmt="%H:%M:%S",
-)
+))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger("main")
 
 
+async def _fetch_pipeline_inputs(
+    provider: DataProvider,
+    sector: str,
+    tickers: list[str],
+    date_str: str,
+) -> tuple[pd.DataFrame, dict[str, pd.DataFrame]]:
+    """
+    Download the sector snapshot (Agent 4's input) and price histories
+    (Agent 5's) for the whole universe at the same time.
+
+    The two downloads are independent and both network-bound, so running them
+    side by side removes the Agent 4 → Agent 5 fetch barrier. Prices are
+    fetched for every raw ticker; the ones that fail screening are simply unused.
+    """
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        return await asyncio.gather(
+            loop.run_in_executor(pool, provider.get_sector_snapshot, sector),
+            loop.run_in_executor(pool, _download_prices, provider, tickers, date_str),
+        )
+
+
+def _download_prices(
+    provider: DataProvider,
+    tickers: list[str],
+    date_str: str,
+) -> dict[str, pd.DataFrame]:
+    try:
+        return provider.get_price_history_batch(tickers, lookback_start_date(date_str), date_str)
+    except DataProviderError as e:
+        # Agent 5 retries whatever is missing through the wrapped provider
+        logger.warning("Price prefetch failed: %s", e)
+        return {}
+
+
 def run_pipeline(sector: str, as_of_date: str | None = None) -> None:
     """
     Full quant engine pipeline for a single sector.
@@ -33,34 +99,46 @@ def run_pipeline(sector: str, as_of_date: str | None = None) -> None:
         as_of_date: 'YYYY-MM-DD' — run as of this date. Defaults to today.
     """
     date_str = as_of_date or datetime.today().strftime("%Y-%m-%d")
-    logger.info(f"━━━ Quant Engine | Sector: {sector} | As of: {date_str} ━━━")
+    logger.info("━━━ Quant Engine | Sector: %s | As of: %s ━━━", sector, date_str)
 
     # ── Initialise data provider ──────────────────────────────────────────────
     # Swap YFinanceProvider for your production provider here when ready.
-    data_provider = YFinanceProvider()
+    # Repeat runs for the same date are served from the on-disk memo.
+    # The provider's one keep-alive session (see build_session) carries
+    # every Agent 4 and 5 request.
+    data_provider = MemoizingProvider(
+        YFinanceProvider(),
+        DiskMemo(MEMO_CACHE_PATH, ttl_seconds=MEMO_TTL_SECONDS),
+        as_of_date=date_str,
+    )
 
     # ── Agent 4: Hard Screening ───────────────────────────────────────────────
     logger.info("Agent 4 — Fetching sector universe and screening...")
     raw_tickers = data_provider.get_tickers_for_sector(sector)
-    logger.info(f"Raw universe: {len(raw_tickers)} tickers")
+    logger.info("Raw universe: %d tickers", len(raw_tickers))
 
-    passed_tickers, screening_results = screen_universe(raw_tickers, data_provider)
+    # Fetch the sector snapshot and prices concurrently, once; Agents 4 and 5
+    # then read them from memory through the DictProvider
+    snapshot, price_frames = asyncio.run(
+        _fetch_pipeline_inputs(data_provider, sector, raw_tickers, date_str)
+    )
+    data_provider = DictProvider.from_snapshot(data_provider, snapshot, price_frames)
+
+    # Only the passing tickers are used downstream, so skip building reasons
+    passed_tickers = screen_universe(raw_tickers, data_provider, return_reasons=False)
 
     if not passed_tickers:
         logger.error("Agent 4: No tickers passed screening. Halting.")
         return
 
-    logger.info(f"Agent 4 complete: {len(passed_tickers)} tickers passed screening")
+    logger.info("Agent 4 complete: %d tickers passed screening", len(passed_tickers))
 
     # ── Agent 5: Factor Scoring ───────────────────────────────────────────────
     logger.info("Agent 5 — Computing factor scores...")
     factor_scores = compute_factor_scores(passed_tickers, data_provider, as_of_date=date_str)
 
-    scored_count = sum(
-        1 for s in factor_scores
-        if any(v is not None for v in [s.momentum, s.quality, s.low_vol])
-    )
-    logger.info(f"Agent 5 complete: {scored_count}/{len(passed_tickers)} stocks scored")
+    scored_count = factor_scores.scored_count
+    logger.info("Agent 5 complete: %d/%d stocks scored", scored_count, len(passed_tickers))
 
     if scored_count == 0:
         logger.error("Agent 5: No stocks could be scored. Halting.")
@@ -75,22 +153,30 @@ def run_pipeline(sector: str, as_of_date: str | None = None) -> None:
         return
 
     # ── Output ────────────────────────────────────────────────────────────────
-    print("\n" + "━" * 55)
-    print(f"  TOP PICKS — {sector.upper()} | {date_str}")
-    print("━" * 55)
-    print(f"  {'Rank':<6} {'Ticker':<8} {'Score':>8}  {'Mom':>7}  {'Qual':>7}  {'Vol':>7}")
-    print("  " + "─" * 50)
-    for stock in ranked:
-        print(
-            f"  {stock.rank:<6} {stock.ticker:<8} "
-            f"{stock.composite_score:>8.3f}  "
-            f"{stock.momentum_z:>7.3f}  "
-            f"{stock.quality_z:>7.3f}  "
-            f"{stock.low_vol_z:>7.3f}"
-        )
-    print("━" * 55)
-    print(f"  → Passing to Agent 7: {[s.ticker for s in ranked]}")
-    print("━" * 55 + "\n")
+    # Build the whole table first and write it with one print
+    rule = "━" * 55
+    lines = [
+        "",
+        rule,
+        f"  TOP PICKS — {sector.upper()} | {date_str}",
+        rule,
+        f"  {'Rank':<6} {'Ticker':<8} {'Score':>8}  {'Mom':>7}  {'Qual':>7}  {'Vol':>7}",
+        "  " + "─" * 50,
+    ]
+    lines.extend(
+        f"  {stock.rank:<6} {stock.ticker:<8} "
+        f"{stock.composite_score:>8.3f}  "
+        f"{stock.momentum_z:>7.3f}  "
+        f"{stock.quality_z:>7.3f}  "
+        f"{stock.low_vol_z:>7.3f}"
+        for stock in ranked
+    )
+    lines += [
+        rule,
+        f"  → Passing to Agent 7: {[s.ticker for s in ranked]}",
+        rule + "\n",
+    ]
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
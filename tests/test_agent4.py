@@ -4,7 +4,8 @@
 
 import pytest
 from data.skeleton.base_provider import DataProvider, DataProviderError
-from agents.quant.agent4_screener import screen_universe
+from data.skeleton.in_memory_provider import DictProvider, download_fundamentals
+from agents.quant.agent4_screener import screen_universe, screen_universe_vectorized
 import pandas as pd
 
 
@@ -93,3 +94,62 @@ def test_none_market_cap_fails():
     provider = MockDataProvider({"NONE": bad})
     passed, _ = screen_universe(["NONE"], provider)
     assert "NONE" not in passed
+
+
+def test_vectorized_reports_first_failing_filter():
+    df = pd.DataFrame.from_dict({
+        "GOOD": GOOD_FUNDAMENTALS,
+        "BOTH": {**GOOD_FUNDAMENTALS, "price": 1.0, "market_cap": 1_000_000},
+        "NODTE": {**GOOD_FUNDAMENTALS, "debt_to_equity": None},
+    }, orient="index")
+    passed, mask, reasons = screen_universe_vectorized(df)
+
+    assert passed == ["GOOD", "NODTE"]
+    assert mask.tolist() == [True, False, True]
+    assert reasons[1].startswith("Market cap")  # checked before price
+    assert reasons[0] == reasons[2] == "All filters passed"
+
+
+def test_prefetched_fundamentals_screen_like_live_ones():
+    data = {"GOOD": GOOD_FUNDAMENTALS, "SMOL": {**GOOD_FUNDAMENTALS, "market_cap": 1_000_000}}
+    live = MockDataProvider(data)
+    tickers = ["GOOD", "SMOL", "UNKN"]
+
+    prefetched = DictProvider(live, download_fundamentals(live, tickers, threads=4))
+    expected = screen_universe(tickers, live)
+    assert screen_universe(tickers, prefetched) == expected
+    assert expected[1][2].reason == "Data unavailable: No mock data for UNKN"
+
+
+def test_fast_path_passes_the_same_tickers():
+    data = {
+        "GOOD": GOOD_FUNDAMENTALS,
+        "BAD1": {**GOOD_FUNDAMENTALS, "market_cap": 50_000_000},
+        "ALSO_GOOD": {**GOOD_FUNDAMENTALS, "debt_to_equity": None},
+    }
+    provider = MockDataProvider(data)
+    tickers = ["ALSO_GOOD", "UNKN", "BAD1", "GOOD"]
+
+    passed, _ = screen_universe(tickers, provider)
+    assert screen_universe(tickers, provider, return_reasons=False) == passed
+
+
+def test_sector_snapshot_screens_like_live_fundamentals():
+    data = {
+        "GOOD": GOOD_FUNDAMENTALS,
+        "NODTE": {**GOOD_FUNDAMENTALS, "debt_to_equity": None},
+        "SMOL": {**GOOD_FUNDAMENTALS, "market_cap": 1_000_000},
+    }
+    tickers = ["GOOD", "UNKN", "NODTE", "SMOL"]
+
+    class SectorProvider(MockDataProvider):
+        def get_tickers_for_sector(self, sector):
+            return tickers
+
+    live = SectorProvider(data)
+    snapshot = live.get_sector_snapshot("Test")
+    assert snapshot.index.tolist() == ["GOOD", "NODTE", "SMOL"]  # UNKN omitted
+
+    prefetched = DictProvider.from_snapshot(live, snapshot)
+    assert screen_universe(tickers, prefetched, return_reasons=False) == ["GOOD", "NODTE"]
+    assert prefetched.get_fundamentals("NODTE").debt_to_equity is None
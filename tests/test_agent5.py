@@ -2,12 +2,17 @@
 # Tests for Agent 5 factor computation.
 # Uses synthetic price and fundamentals data.
 
+import functools
+
 import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from data.skeleton.base_provider import DataProvider, DataProviderError
 from agents.quant.agent5_factors import (
+    compute_factor_scores,
+    compute_factor_scores_vectorized,
     _compute_momentum,
     _compute_quality,
     _compute_volatility,
@@ -18,17 +23,50 @@ from agents.quant.agent5_factors import (
 
 def make_price_df(n_days: int, start_price: float = 100.0, drift: float = 0.001) -> pd.DataFrame:
     """Generate synthetic price history with a given drift."""
+    # Copy so a test that mutates its frame can't leak into the cached one
+    return _make_price_df_cached(n_days, start_price, drift).copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _make_price_df_cached(n_days: int, start_price: float, drift: float) -> pd.DataFrame:
     dates = pd.date_range(end=datetime.today(), periods=n_days, freq="B")
     np.random.seed(42)
     returns = np.random.normal(drift, 0.015, n_days)
     prices = start_price * np.cumprod(1 + returns)
-    return pd.DataFrame({
-        "open":   prices * 0.99,
-        "high":   prices * 1.01,
-        "low":    prices * 0.98,
-        "close":  prices,
-        "volume": np.full(n_days, 1_000_000),
-    }, index=dates)
+    # One (n_days, 5) block: OHLC as fixed ratios of close, then constant volume
+    data = np.empty((n_days, 5), dtype=np.float64)
+    data[:, :4] = prices[:, None] * _OHLC_RATIOS
+    data[:, 4] = 1_000_000
+    return pd.DataFrame(data, columns=["open", "high", "low", "close", "volume"], index=dates)
+
+
+_OHLC_RATIOS = np.array([0.99, 1.01, 0.98, 1.00])
+
+
+class MockDataProvider(DataProvider):
+    """Synthetic data provider that records how prices were requested."""
+
+    def __init__(self, prices_map: dict, fundamentals_map: dict):
+        self._prices = prices_map
+        self._fundamentals = fundamentals_map
+        self.batch_calls = 0
+
+    def get_price_history(self, ticker, start_date, end_date):
+        if ticker not in self._prices:
+            raise DataProviderError(f"No mock prices for {ticker}")
+        return self._prices[ticker]
+
+    def get_price_history_batch(self, tickers, start_date, end_date):
+        self.batch_calls += 1
+        return super().get_price_history_batch(tickers, start_date, end_date)
+
+    def get_fundamentals(self, ticker):
+        if ticker not in self._fundamentals:
+            raise DataProviderError(f"No mock data for {ticker}")
+        return self._fundamentals[ticker]
+
+    def get_tickers_for_sector(self, sector):
+        raise NotImplementedError("Not used in Agent 5 tests")
 
 
 # ── Momentum tests ────────────────────────────────────────────────────────────
@@ -115,3 +153,59 @@ def test_volatility_returns_none_for_short_history():
     df = make_price_df(10)  # not enough
     vol = _compute_volatility(df)
     assert vol is None
+
+
+def test_volatility_returns_none_for_non_positive_price():
+    df = make_price_df(100)
+    df.iloc[-5, df.columns.get_loc("close")] = 0.0
+    assert _compute_volatility(df) is None
+
+
+# ── compute_factor_scores tests ───────────────────────────────────────────────
+
+def test_compute_factor_scores_fetches_prices_in_one_batch():
+    fundamentals = {"return_on_equity": 0.20, "debt_to_equity": 1.0}
+    up = make_price_df(300)
+    down = make_price_df(300, drift=-0.002).set_axis(up.index)  # one shared date index
+    provider = MockDataProvider(
+        prices_map={"AAA": up, "BBB": down},
+        fundamentals_map={"AAA": fundamentals, "BBB": fundamentals},
+    )
+    batch = compute_factor_scores(["AAA", "BBB", "MISSING"], provider)
+
+    assert provider.batch_calls == 1
+    assert batch.tickers == ["AAA", "BBB", "MISSING"]
+    assert not np.isnan(batch.momentum[0])
+    assert np.isnan(batch.momentum[2]) and np.isnan(batch.quality[2])
+    assert batch.scored_count == 2
+
+
+def test_vectorized_matches_scalar_helpers():
+    fundamentals = {"return_on_equity": 0.25, "debt_to_equity": None}
+    up = make_price_df(300, drift=0.003)
+    down = make_price_df(300, drift=-0.003).set_axis(up.index)
+    price_matrix = pd.DataFrame({"UP": up["close"], "DOWN": down["close"]})
+    fundamentals_df = pd.DataFrame.from_dict({"UP": fundamentals, "DOWN": fundamentals}, orient="index")
+
+    scores = compute_factor_scores_vectorized(["UP", "DOWN"], price_matrix, fundamentals_df).to_list()
+
+    for score, df in zip(scores, [up, down]):
+        assert score.momentum == pytest.approx(_compute_momentum(df))
+        assert score.quality == pytest.approx(_compute_quality(fundamentals))
+        assert score.low_vol == pytest.approx(_compute_volatility(df))
+
+
+def test_vectorized_scores_each_ticker_on_its_own_trading_days():
+    fundamentals = {"return_on_equity": 0.25, "debt_to_equity": 1.0}
+    up = make_price_df(300, drift=0.003)
+    down = make_price_df(300, drift=-0.003).set_axis(up.index)
+    gappy = up.drop(up.index[-10])   # one missing bar inside the vol window
+    lagging = down.iloc[:-1]         # no bar for the final date
+    price_matrix = pd.DataFrame({"GAP": gappy["close"], "LAG": lagging["close"]})
+    fundamentals_df = pd.DataFrame.from_dict({"GAP": fundamentals, "LAG": fundamentals}, orient="index")
+
+    scores = compute_factor_scores_vectorized(["GAP", "LAG"], price_matrix, fundamentals_df).to_list()
+
+    for score, df in zip(scores, [gappy, lagging]):
+        assert score.momentum == pytest.approx(_compute_momentum(df))
+        assert score.low_vol == pytest.approx(_compute_volatility(df))
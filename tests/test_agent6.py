@@ -1,9 +1,10 @@
 # tests/test_agent6.py
 # Tests for Agent 6 composite scoring and ranking.
 
+import numpy as np
 import pytest
-from agents.quant.agent5_factors import FactorScores
-from agents.scoring.agent6_ranker import rank_stocks
+from agents.quant.agent5_factors import FactorScores, FactorScoresBatch
+from agents.scoring.agent6_ranker import rank_stocks, _rank_kernel, _rank_numpy, _top_k
 
 
 def make_score(ticker, momentum, quality, low_vol):
@@ -76,3 +77,30 @@ def test_returns_fewer_than_n_if_universe_small():
     scores = [make_score("ONLY", 0.2, 0.5, 0.15)]
     result = rank_stocks(scores, top_n=3)
     assert len(result) == 1
+
+
+def test_accepts_factor_scores_batch():
+    scores = [make_score(f"T{i}", 0.05 * i, 0.5 - 0.01 * i, None) for i in range(6)]
+    from_list  = rank_stocks(scores, top_n=3)
+    from_batch = rank_stocks(FactorScoresBatch.from_scores(scores), top_n=3)
+    assert from_batch == from_list
+
+
+def test_numpy_path_matches_kernel():
+    rng = np.random.default_rng(0)
+    factors = rng.normal(size=(3, 12))
+    factors[rng.random(factors.shape) < 0.2] = np.nan
+    factors[2, :] = 0.3    # zero spread → neutral z-scores
+    weights = np.array([0.4, 0.35, 0.25])
+
+    z_k, comp_k = _rank_kernel(*factors, weights)
+    z_n, comp_n = _rank_numpy(*factors, weights)
+
+    np.testing.assert_allclose(z_n, z_k, atol=1e-12)
+    np.testing.assert_allclose(comp_n, comp_k, atol=1e-12)
+
+
+def test_top_k_breaks_ties_at_the_cutoff_by_position():
+    composite = np.array([2.0, 0.0, 1.0, 0.0, 0.0, 3.0, 0.0])
+    assert _top_k(composite, 4).tolist() == [5, 0, 2, 1]
+    assert _top_k(composite, 7).tolist() == [5, 0, 2, 1, 3, 4, 6]
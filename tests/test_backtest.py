@@ -0,0 +1,92 @@
+# tests/test_backtest.py
+# Tests for the backtest loop and the in-memory provider it runs on.
+# Uses a MockDataProvider with synthetic data — no network calls, always fast.
+
+import numpy as np
+import pandas as pd
+
+from data.skeleton.base_provider import DataProvider, DataProviderError
+from data.skeleton.in_memory_provider import DictProvider, SlicedProvider
+from backtesting.backtest import run_backtest
+
+
+TICKERS = ["AAA", "BBB", "CCC", "DDD"]
+
+FUNDAMENTALS = {
+    "market_cap":        5_000_000_000,
+    "avg_daily_volume":  10_000_000,
+    "debt_to_equity":    1.0,
+    "return_on_equity":  0.20,
+    "earnings_per_share": 3.50,
+    "price":             100.0,
+}
+
+
+def make_prices(seed: int) -> pd.DataFrame:
+    dates = pd.date_range("2021-01-01", "2023-12-31", freq="B")
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1 + rng.normal(0.0005, 0.015, len(dates)))
+    return pd.DataFrame({
+        "open": close, "high": close, "low": close, "close": close,
+        "volume": np.full(len(dates), 1_000_000.0),
+    }, index=dates)
+
+
+class MockDataProvider(DataProvider):
+    """Serves synthetic data and counts calls so tests can assert on fetch volume."""
+
+    def __init__(self):
+        self._prices = {t: make_prices(i) for i, t in enumerate(TICKERS)}
+        self.price_calls = 0
+        self.fundamentals_calls = 0
+        self.prefetched: list[list[str]] = []
+
+    def get_price_history(self, ticker, start_date, end_date):
+        self.price_calls += 1
+        if ticker not in self._prices:
+            raise DataProviderError(f"No mock prices for {ticker}")
+        return self._prices[ticker].loc[start_date:end_date]
+
+    def get_fundamentals(self, ticker):
+        self.fundamentals_calls += 1
+        return dict(FUNDAMENTALS)
+
+    def prefetch_fundamentals(self, tickers):
+        self.prefetched.append(list(tickers))
+
+    def get_tickers_for_sector(self, sector):
+        return TICKERS
+
+
+def test_sliced_provider_uses_half_open_window():
+    inner = MockDataProvider()
+    provider = SlicedProvider.prefetch(inner, ["AAA"], "2022-01-01", "2023-12-31")
+    df = provider.get_price_history("AAA", "2022-03-01", "2022-03-08")
+
+    assert df.index.min() >= pd.Timestamp("2022-03-01")
+    assert df.index.max() < pd.Timestamp("2022-03-08")
+    assert inner.price_calls == 1  # only the up-front prefetch
+
+
+def test_dict_provider_batch_fetches_only_missing_tickers():
+    inner = MockDataProvider()
+    prefetched = inner.get_price_history_batch(["AAA", "BBB"], "2022-01-01", "2023-12-31")
+    provider = DictProvider(inner, {}, prefetched)
+    inner.price_calls = 0
+
+    histories = provider.get_price_history_batch(TICKERS, "2022-03-01", "2022-06-01")
+
+    assert list(histories) == TICKERS
+    assert inner.price_calls == 2  # CCC and DDD only
+    assert histories["AAA"].index.max() < pd.Timestamp("2022-06-01")
+
+
+def test_backtest_fetches_each_ticker_once():
+    inner = MockDataProvider()
+    result = run_backtest("Test", inner, "2023-01-02", "2023-01-31", frequency="W", max_workers=2)
+
+    assert len(result.snapshots) == 4  # weekly anchors fall on Sundays
+    assert [s.date for s in result.snapshots] == sorted(s.date for s in result.snapshots)
+    assert inner.price_calls == len(TICKERS)
+    assert inner.fundamentals_calls == len(TICKERS)
+    assert inner.prefetched == [TICKERS]  # one batched prefetch for the whole run
@@ -0,0 +1,87 @@
+# tests/test_memo.py
+# Tests for the on-disk memo table and the MemoizingProvider built on it.
+# Uses a MockDataProvider with synthetic data — no network calls, always fast.
+
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from data.skeleton.base_provider import DataProvider, Fundamentals
+from data.skeleton.memoizing_provider import MemoizingProvider
+from utils.memo import DiskMemo
+
+
+TICKERS = ["AAA", "BBB"]
+
+FUNDAMENTALS = {
+    "market_cap":        5_000_000_000,
+    "avg_daily_volume":  10_000_000,
+    "debt_to_equity":    1.0,
+    "return_on_equity":  0.20,
+    "earnings_per_share": 3.50,
+    "price":             100.0,
+}
+
+
+class MockDataProvider(DataProvider):
+    """Serves synthetic data and counts calls so tests can assert on fetch volume."""
+
+    def __init__(self):
+        self.price_calls = 0
+        self.fundamentals_calls = 0
+
+    def get_price_history(self, ticker, start_date, end_date):
+        self.price_calls += 1
+        dates = pd.date_range(start_date, end_date, freq="B", inclusive="left")
+        close = np.full(len(dates), 100.0)
+        return pd.DataFrame({
+            "open": close, "high": close, "low": close, "close": close,
+            "volume": np.full(len(dates), 1_000_000.0),
+        }, index=dates)
+
+    def get_fundamentals(self, ticker):
+        self.fundamentals_calls += 1
+        return dict(FUNDAMENTALS)
+
+    def get_tickers_for_sector(self, sector):
+        return TICKERS
+
+
+def test_memo_expires_entries_past_ttl(tmp_path):
+    memo = DiskMemo(str(tmp_path / "memo.sqlite"), ttl_seconds=-1)
+    memo.update(("k",), 1)
+    assert memo.lookup(("k",)) is DiskMemo.MISSING
+
+
+def test_expired_entries_are_deleted_on_open(tmp_path):
+    path = str(tmp_path / "memo.sqlite")
+    DiskMemo(path, ttl_seconds=None).update(("k",), 1)
+
+    DiskMemo(path, ttl_seconds=-1)
+    with closing(sqlite3.connect(path)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM memo").fetchone() == (0,)
+
+
+def test_repeat_runs_are_served_from_disk(tmp_path):
+    path = str(tmp_path / "memo.sqlite")
+
+    first = MockDataProvider()
+    provider = MemoizingProvider(first, DiskMemo(path), as_of_date="2023-06-01")
+    provider.get_price_history_batch(TICKERS, "2023-01-01", "2023-06-01")
+    assert provider.get_fundamentals("AAA") == Fundamentals(**FUNDAMENTALS)
+
+    # A fresh run on the same date never touches the wrapped provider
+    second = MockDataProvider()
+    provider = MemoizingProvider(second, DiskMemo(path), as_of_date="2023-06-01")
+    histories = provider.get_price_history_batch(TICKERS, "2023-01-01", "2023-06-01")
+    provider.get_fundamentals("AAA")
+    assert list(histories) == TICKERS
+    assert second.price_calls == 0
+    assert second.fundamentals_calls == 0
+
+    # Another as-of date is a different point in time
+    provider = MemoizingProvider(second, DiskMemo(path), as_of_date="2023-06-02")
+    provider.get_fundamentals("AAA")
+    assert second.fundamentals_calls == 1
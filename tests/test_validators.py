@@ -0,0 +1,62 @@
+# tests/test_validators.py
+# Tests for the price history validator.
+# Uses synthetic OHLCV frames — no network calls, always fast.
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from utils.validators import validate_price_history
+
+
+def make_ohlcv(n_days: int = 40, close=None) -> pd.DataFrame:
+    close = np.full(n_days, 100.0) if close is None else close
+    return pd.DataFrame({
+        "open": close, "high": close, "low": close, "close": close,
+        "volume": np.full(n_days, 1_000_000.0),
+    }, index=pd.date_range("2023-01-02", periods=n_days, freq="B"))
+
+
+def test_valid_history_passes():
+    assert validate_price_history(make_ohlcv(), "AAPL")
+
+
+def test_int_close_column_passes():
+    assert validate_price_history(make_ohlcv(close=np.full(40, 100, dtype=np.int64)), "AAPL")
+
+
+def test_too_many_null_closes_fail(caplog):
+    df = make_ohlcv()
+    df.iloc[:3, df.columns.get_loc("close")] = np.nan  # 7.5% > 5%
+
+    with caplog.at_level(logging.ERROR):
+        assert not validate_price_history(df, "AAPL")
+    assert "AAPL: 7.5% of close prices are null" in caplog.text
+
+
+def test_few_null_closes_pass():
+    df = make_ohlcv()
+    df.iloc[5, df.columns.get_loc("close")] = np.nan  # 2.5%
+    assert validate_price_history(df, "AAPL")
+
+
+def test_zero_or_negative_close_fails(caplog):
+    for bad in (0.0, -1.0):
+        df = make_ohlcv()
+        df.iloc[10, df.columns.get_loc("close")] = bad
+        with caplog.at_level(logging.ERROR):
+            assert not validate_price_history(df, "AAPL")
+    assert "Non-positive close prices detected" in caplog.text
+
+
+def test_missing_columns_are_listed_in_schema_order(caplog):
+    df = make_ohlcv().drop(columns=["volume", "open"])
+
+    with caplog.at_level(logging.ERROR):
+        assert not validate_price_history(df, "AAPL")
+    assert "AAPL: Missing columns: ['open', 'volume']" in caplog.text
+
+
+def test_short_history_fails():
+    assert not validate_price_history(make_ohlcv(10), "AAPL")
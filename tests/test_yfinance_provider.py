@@ -0,0 +1,138 @@
+# tests/test_yfinance_provider.py
+# Tests for the yfinance-backed provider.
+# yfinance itself is mocked — no network calls, always fast.
+
+import pickle
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data.skeleton.yfinance_provider as yfinance_provider
+from data.skeleton.base_provider import DataProviderError
+from data.skeleton.in_memory_provider import SlicedProvider
+from data.skeleton.yfinance_provider import YFinanceProvider
+
+
+INFO = {
+    "marketCap":               5_000_000_000,
+    "averageDailyVolume10Day": 10_000_000,
+    "debtToEquity":            1.0,
+    "returnOnEquity":          0.20,
+    "trailingEps":             3.50,
+    "currentPrice":            100.0,
+}
+
+
+class FlakyTicker:
+    """Stands in for yf.Ticker; .info fails for the first `failures` calls per symbol."""
+
+    calls: list[str] = []
+    failures = 0
+
+    def __init__(self, ticker, session=None):
+        self.ticker = ticker
+
+    @property
+    def info(self):
+        FlakyTicker.calls.append(self.ticker)
+        if FlakyTicker.calls.count(self.ticker) <= FlakyTicker.failures:
+            raise TimeoutError("timed out")
+        return dict(INFO)
+
+
+class FakeDownload:
+    """Stands in for yf.download; returns a group_by="ticker" MultiIndex frame."""
+
+    def __init__(self, failing=(), empty=()):
+        self.failing = set(failing)   # any chunk containing one of these raises
+        self.empty = set(empty)       # symbols whose columns are all NaN
+        self.chunks: list[list[str]] = []
+
+    def __call__(self, symbols, **kwargs):
+        chunk = symbols.split()
+        self.chunks.append(chunk)
+        if self.failing & set(chunk):
+            raise ConnectionError("connection reset")
+
+        dates = pd.date_range("2023-01-02", periods=3, freq="B")
+        fields = ["Open", "High", "Low", "Close", "Volume", "Adj Close"]
+        columns = pd.MultiIndex.from_product([chunk, fields])
+        data = np.tile(np.arange(1.0, len(fields) + 1), (len(dates), len(chunk)))
+        raw = pd.DataFrame(data, index=dates, columns=columns)
+        for symbol in self.empty & set(chunk):
+            raw[symbol] = np.nan
+        return raw
+
+
+def symbols(n: int) -> list[str]:
+    return [f"T{i:02d}" for i in range(n)]
+
+
+@pytest.fixture
+def flaky_ticker():
+    FlakyTicker.calls = []
+    FlakyTicker.failures = 1
+    with mock.patch.object(yfinance_provider.yf, "Ticker", FlakyTicker):
+        yield FlakyTicker
+
+
+def test_sliced_yfinance_provider_survives_pickling():
+    dates = pd.date_range("2023-01-02", periods=3, freq="B")
+    prices = {"AAA": pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=dates)}
+    provider = SlicedProvider(YFinanceProvider(), prices)
+
+    restored = pickle.loads(pickle.dumps(provider))
+
+    assert restored.get_price_history("AAA", "2023-01-01", "2023-02-01")["close"].tolist() == [1.0, 2.0, 3.0]
+    assert restored._inner._session is not None
+
+
+def test_failed_prefetch_is_reraised_then_retried(flaky_ticker):
+    provider = YFinanceProvider()
+
+    provider.prefetch_fundamentals(["AAA"])
+    with pytest.raises(DataProviderError, match="timed out"):
+        provider.get_fundamentals("AAA")
+    assert flaky_ticker.calls == ["AAA"]  # the failure is not refetched serially
+
+    provider.prefetch_fundamentals(["AAA"])
+    assert provider.get_fundamentals("AAA").market_cap == INFO["marketCap"]
+    assert flaky_ticker.calls == ["AAA", "AAA"]
+
+
+def test_batch_download_is_split_into_chunks_of_twenty():
+    fake = FakeDownload()
+    with mock.patch.object(yfinance_provider.yf, "download", fake):
+        histories = YFinanceProvider().get_price_history_batch(symbols(45), "2023-01-01", "2023-02-01")
+
+    assert sorted(len(chunk) for chunk in fake.chunks) == [5, 20, 20]
+    assert sorted(histories) == symbols(45)
+
+
+def test_batch_download_slices_and_normalises_each_ticker():
+    fake = FakeDownload(empty={"T01"})
+    with mock.patch.object(yfinance_provider.yf, "download", fake):
+        histories = YFinanceProvider().get_price_history_batch(symbols(2), "2023-01-01", "2023-02-01")
+
+    assert list(histories) == ["T00"]  # the all-NaN ticker is dropped
+    df = histories["T00"]
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert df["close"].tolist() == [4.0, 4.0, 4.0]
+    assert df.index.name == "date"
+
+
+def test_failed_chunk_is_omitted():
+    fake = FakeDownload(failing={"T20"})
+    with mock.patch.object(yfinance_provider.yf, "download", fake):
+        histories = YFinanceProvider().get_price_history_batch(symbols(45), "2023-01-01", "2023-02-01")
+
+    assert sorted(histories) == symbols(20) + symbols(45)[40:]
+
+
+def test_all_chunks_failing_raises():
+    fake = FakeDownload(failing={"T00", "T20", "T40"})
+    with mock.patch.object(yfinance_provider.yf, "download", fake):
+        with pytest.raises(DataProviderError, match="connection reset"):
+            YFinanceProvider().get_price_history_batch(symbols(45), "2023-01-01", "2023-02-01")
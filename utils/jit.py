@@ -0,0 +1,16 @@
+# utils/jit.py
+# Optional Numba JIT for numeric kernels.
+# Kernels import njit from here rather than from numba directly, so the
+# engine still runs (as plain Python/NumPy, just slower) without numba installed.
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover — exercised only where numba is absent
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit; supports both @njit and @njit(...)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
@@ -0,0 +1,74 @@
+# utils/memo.py
+# On-disk memo table for expensive, deterministic lookups.
+# Backed by SQLite from the standard library, so repeat runs on the same
+# date skip the network without any extra dependency.
+
+import os
+import pickle
+import sqlite3
+import time
+from contextlib import closing
+
+_MISSING = object()
+
+
+class DiskMemo:
+    """
+    Persistent key → value table with a time-to-live.
+
+    Keys are tuples of plain values (e.g. (ticker, as_of_date)); values are
+    pickled. Each lookup/update opens its own short-lived connection, so one
+    instance is safe to share across threads and to pickle.
+
+    Usage:
+        value = memo.lookup(key)
+        if value is memo.MISSING:
+            value = expensive(...)
+            memo.update(key, value)
+    """
+
+    MISSING = _MISSING
+
+    def __init__(self, path: str, ttl_seconds: float | None = 86_400):
+        self._path = path
+        self._ttl = ttl_seconds
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS memo "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value BLOB NOT NULL)"
+            )
+            # Every run date adds new keys, so purge expired rows rather than
+            # letting the file grow without bound
+            if ttl_seconds is not None:
+                conn.execute(
+                    "DELETE FROM memo WHERE stored_at < ?", (time.time() - ttl_seconds,)
+                )
+
+    def lookup(self, key: tuple):
+        """Return the stored value for key, or DiskMemo.MISSING if absent or expired."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT stored_at, value FROM memo WHERE key = ?", (repr(key),)
+            ).fetchone()
+        if row is None:
+            return _MISSING
+        stored_at, blob = row
+        if self._ttl is not None and time.time() - stored_at > self._ttl:
+            return _MISSING
+        return pickle.loads(blob)
+
+    def update(self, key: tuple, value) -> None:
+        """Store value under key, replacing any earlier entry."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO memo (key, stored_at, value) VALUES (?, ?, ?)",
+                (repr(key), time.time(), blob),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # Generous timeout: concurrent fetch threads may write at the same time
+        return sqlite3.connect(self._path, timeout=30)
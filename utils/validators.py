@@ -4,10 +4,17 @@
 # The system should halt on bad data, not trade on it.
 
 import logging
+import numpy as np
 import pandas as pd
 
+from data.skeleton.base_provider import Fundamentals
+from utils.jit import njit
+
 logger = logging.getLogger(__name__)
 
+# OHLCV schema every provider returns (see DataProvider.get_price_history)
+_REQUIRED_PRICE_COLS = ("open", "high", "low", "close", "volume")
+
 
 def validate_price_history(df: pd.DataFrame, ticker: str, min_rows: int = 30) -> bool:
     """
@@ -15,44 +22,60 @@ def validate_price_history(df: pd.DataFrame, ticker: str, min_rows: int = 30) ->
     Logs specific issues and returns False if data is not fit for use.
     """
     if df is None or df.empty:
-        logger.error(f"{ticker}: Price history is empty")
+        logger.error("%s: Price history is empty", ticker)
         return False
 
-    required_cols = {"open", "high", "low", "close", "volume"}
-    missing = required_cols - set(df.columns)
+    cols = df.columns
+    missing = [c for c in _REQUIRED_PRICE_COLS if c not in cols]
     if missing:
-        logger.error(f"{ticker}: Missing columns: {missing}")
+        logger.error("%s: Missing columns: %s", ticker, missing)
         return False
 
     if len(df) < min_rows:
-        logger.error(f"{ticker}: Only {len(df)} rows, need at least {min_rows}")
+        logger.error("%s: Only %d rows, need at least %d", ticker, len(df), min_rows)
         return False
 
-    null_pct = df["close"].isna().mean()
+    # Both close checks from a single loop over the column
+    nan_count, min_close = _close_stats(df["close"].to_numpy(dtype=np.float64))
+    null_pct = nan_count / len(df)
     if null_pct > 0.05:
-        logger.error(f"{ticker}: {null_pct:.1%} of close prices are null")
+        logger.error("%s: %.1f%% of close prices are null", ticker, null_pct * 100)
         return False
 
-    if (df["close"] <= 0).any():
-        logger.error(f"{ticker}: Non-positive close prices detected")
+    if min_close <= 0:
+        logger.error("%s: Non-positive close prices detected", ticker)
         return False
 
     return True
 
 
-def validate_fundamentals(fundamentals: dict, ticker: str) -> bool:
+def validate_fundamentals(fundamentals: Fundamentals | dict, ticker: str) -> bool:
     """
-    Validate a fundamentals dict.
+    Validate fundamentals (a Fundamentals record or a dict with the same keys).
     Returns False if critical fields are missing entirely.
     """
     if not fundamentals:
-        logger.error(f"{ticker}: Fundamentals dict is empty")
+        logger.error("%s: Fundamentals dict is empty", ticker)
         return False
 
+    fundamentals = Fundamentals.coerce(fundamentals)
     critical_fields = ["market_cap", "price"]
     for field in critical_fields:
-        if fundamentals.get(field) is None:
-            logger.warning(f"{ticker}: Critical field '{field}' is None")
+        if getattr(fundamentals, field) is None:
+            logger.warning("%s: Critical field '%s' is None", ticker, field)
             # Warning only — agents handle None gracefully via their own filters
 
     return True
+
+
+@njit(cache=True)
+def _close_stats(close: np.ndarray) -> tuple[int, float]:
+    """NaN count and minimum of the non-NaN values (inf if none), in one pass."""
+    nan_count = 0
+    min_close = np.inf
+    for x in close:
+        if np.isnan(x):
+            nan_count += 1
+        elif x < min_close:
+            min_close = x
+    return nan_count, min_close